@@ -0,0 +1,79 @@
+import os
+import statistics
+import subprocess
+import sys
+
+# Mede o tempo de importacao do ponto de entrada com 'python -X importtime' e
+# falha (codigo de saida 1) se o orcamento for excedido ou se 'src.main'
+# voltar a importar o analisador de forma antecipada.
+#
+# Uso: python bench_importtime.py [orcamento_main_us] [orcamento_cli_us] [repeticoes]
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Orcamentos em microssegundos (tempo cumulativo, com .pyc ja gerados)
+MAIN_BUDGET_US = 2000   # import src.main
+CLI_BUDGET_US = 5000    # import src.main + src.parser (caminho do CLI)
+REPEAT = 7
+
+# Modulos que 'import src.main' nao deve carregar
+LAZY_MODULES = ('src.ast', 'src.lexer', 'src.parser', 'enum', 're', 'typing')
+
+
+def importtime(statement: str) -> dict:
+    """Executa 'statement' em um interpretador novo e retorna {modulo: cumulativo_us}."""
+    env = dict(os.environ)
+    # Sem .pyc em cache a medicao incluiria a compilacao dos fontes
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                          cwd=ROOT, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Erro de Benchmark: '{statement}' falhou:\n{proc.stderr}")
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(statement: str, module: str, repeat: int):
+    importtime(statement)  # aquecimento: gera os .pyc
+    runs = [importtime(statement) for _ in range(repeat)]
+    return statistics.median(run[module] for run in runs), runs[-1]
+
+
+def main(argv) -> int:
+    main_budget = int(argv[1]) if len(argv) > 1 else MAIN_BUDGET_US
+    cli_budget = int(argv[2]) if len(argv) > 2 else CLI_BUDGET_US
+    repeat = int(argv[3]) if len(argv) > 3 else REPEAT
+    ok = True
+
+    main_us, modules = measure('import src.main', 'src.main', repeat)
+    print(f"   [Importtime]: src.main {main_us:.0f}us (orçamento {main_budget}us)")
+    if main_us > main_budget:
+        print(f"FALHA: import src.main excede o orçamento em {main_us - main_budget:.0f}us")
+        ok = False
+    # Modulos ja carregados pela inicializacao do interpretador (site, .pth) nao contam
+    startup = importtime('pass')
+    eager = [name for name in LAZY_MODULES if name in modules and name not in startup]
+    if eager:
+        print(f"FALHA: src.main importa antecipadamente: {', '.join(eager)}")
+        ok = False
+
+    parser_stmt = 'import src.main, src.parser'
+    parser_us, _ = measure(parser_stmt, 'src.parser', repeat)
+    cli_us = main_us + parser_us
+    print(f"   [Importtime]: src.main + src.parser {cli_us:.0f}us (orçamento {cli_budget}us)")
+    if cli_us > cli_budget:
+        print(f"FALHA: caminho do CLI excede o orçamento em {cli_us - cli_budget:.0f}us")
+        ok = False
+
+    if ok:
+        print("SUCESSO: tempo de importação dentro do orçamento.")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -1,7 +1,11 @@
 import re
+import sys
 
 def tokenize(code):
-    tokens = re.findall(r'\(|\)|[^\s()]+', code)
+    # Comentarios (';' ate o fim da linha) nao fazem parte da AST
+    code = re.sub(r';[^\n]*', '', code)
+    # Nomes repetidos (ex.: em um ':init' grande) compartilham uma unica string
+    tokens = [sys.intern(t) for t in re.findall(r'\(|\)|[^\s()]+', code)]
     return tokens
 
 def parse_tokens(tokens):
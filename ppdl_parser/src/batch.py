@@ -0,0 +1,132 @@
+import os
+import time
+from typing import Callable, Iterable, Iterator, Optional
+
+from .ast import parse_file_to_ast
+from .canonical import ResultCache, cache_key, domain_hash, problem_hash
+from .grounding import GroundTask, PreparedDomain, ground_task
+from .task import Task, build_domain, build_problem
+from .workers import worker_pool, worker_state
+
+# Pipeline "um dominio / muitos problemas": o dominio e lido, convertido e
+# pre-processado (esquemas, indice de tipos, regras Datalog, predicados
+# estaticos) uma unica vez. Os processos de trabalho recebem esse modelo pelo
+# inicializador do pool (src/workers.py). Cada problema custa apenas sua
+# propria leitura e aterramento.
+
+
+class BatchResult:
+    def __init__(self, problem_path: str, problem_name: Optional[str] = None,
+                 value=None, error: Optional[str] = None, elapsed: float = 0.0,
+                 problem_hash: Optional[str] = None, cached: bool = False):
+        self.problem_path = problem_path
+        self.problem_name = problem_name
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+        # Hash estrutural canonico (src/canonical.py); iguais => problemas duplicados
+        self.problem_hash = problem_hash
+        self.cached = cached
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self):
+        status = 'ok' if self.ok else f'erro: {self.error}'
+        if self.cached:
+            status += ', cache'
+        return f"BatchResult({self.problem_path}, {status}, {self.elapsed:.3f}s)"
+
+
+def grounding_summary(ground: GroundTask) -> dict:
+    """Job padrao: estatisticas do aterramento."""
+    return {
+        'atoms': len(ground.atoms),
+        'actions': len(ground.actions),
+        'goal_reachable': ground.goal is not False,
+    }
+
+
+def prepare_domain(domain_path: str) -> PreparedDomain:
+    return PreparedDomain(build_domain(parse_file_to_ast(domain_path)))
+
+
+def job_namespace(job: Callable[[GroundTask], object]) -> str:
+    """Namespace padrao do cache para um job: seu nome qualificado."""
+    name = f"{job.__module__}.{job.__qualname__}"
+    if '<lambda>' in name or '<locals>' in name:
+        raise RuntimeError(f"Erro de Cache: o job '{name}' não tem nome estável; "
+                           f"informe 'cache_namespace'")
+    return name
+
+
+def process_problem(prepared: PreparedDomain, problem_path: str,
+                    job: Callable[[GroundTask], object] = grounding_summary,
+                    cache: Optional[ResultCache] = None,
+                    domain_key: str = '', namespace: str = '') -> BatchResult:
+    """'domain_key' (domain_hash) e 'namespace' entram na chave do cache."""
+    start = time.perf_counter()
+    try:
+        problem = build_problem(parse_file_to_ast(problem_path))
+        structure = problem_hash(problem)
+        key = cache_key(structure, domain_key, namespace)
+        if cache is not None and key in cache:
+            return BatchResult(problem_path, problem.name, cache.get(key),
+                               elapsed=time.perf_counter() - start, problem_hash=structure, cached=True)
+        ground = ground_task(Task(prepared.domain, problem, verbose=False), prepared, verbose=False)
+        value = job(ground)
+        if cache is not None:
+            cache.put(key, value)
+        return BatchResult(problem_path, problem.name, value, elapsed=time.perf_counter() - start,
+                           problem_hash=structure)
+    except Exception as e:
+        # Um problema invalido nao pode derrubar o lote inteiro
+        return BatchResult(problem_path, error=str(e), elapsed=time.perf_counter() - start)
+
+
+def _run_in_worker(problem_path: str) -> BatchResult:
+    state = worker_state()
+    return process_problem(state['prepared'], problem_path, state['job'], state['cache'],
+                           *state['cache_prefix'])
+
+
+def run_batch(domain_path: str, problem_paths: Iterable[str],
+              job: Callable[[GroundTask], object] = grounding_summary,
+              processes: Optional[int] = None, chunksize: int = 8,
+              cache: Optional[ResultCache] = None,
+              cache_namespace: Optional[str] = None) -> Iterator[BatchResult]:
+    """Processa os problemas em paralelo contra um unico dominio pre-processado.
+
+    Os resultados sao produzidos na ordem de conclusao. 'job' recebe a tarefa
+    aterrada; com 'spawn' ele precisa ser uma funcao de nivel de modulo.
+    Com 'cache', problemas estruturalmente iguais a um ja processado, com o
+    mesmo conteudo de dominio e o mesmo job, reutilizam o resultado. A chave
+    inclui 'cache_namespace' (padrao: nome qualificado do job; obrigatorio
+    para lambdas e funcoes locais). Cada processo usa uma copia do cache feita
+    na criacao do pool: duplicatas processadas ao mesmo tempo por processos
+    diferentes sao calculadas em ambos. O processo principal registra os novos
+    resultados e contabiliza em 'cache.hits' os acertos dos processos.
+    """
+    prepared = prepare_domain(domain_path)
+    cache_prefix = ('', '')
+    if cache is not None:
+        namespace = cache_namespace if cache_namespace is not None else job_namespace(job)
+        cache_prefix = (domain_hash(prepared.domain), namespace)
+    problem_paths = list(problem_paths)
+    processes = processes or os.cpu_count() or 1
+
+    if processes == 1 or len(problem_paths) <= 1:
+        for path in problem_paths:
+            yield process_problem(prepared, path, job, cache, *cache_prefix)
+        return
+
+    with worker_pool(processes, prepared=prepared, job=job, cache=cache,
+                     cache_prefix=cache_prefix) as pool:
+        for result in pool.imap_unordered(_run_in_worker, problem_paths, chunksize=chunksize):
+            if cache is not None and result.ok:
+                if result.cached:
+                    cache.hits += 1
+                else:
+                    cache.put(cache_key(result.problem_hash, *cache_prefix), result.value)
+            yield result
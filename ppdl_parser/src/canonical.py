@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+from typing import Callable, Dict, Optional
+
+from .task import Domain, Problem
+
+# Hash estrutural canonico de problemas: dois problemas que diferem apenas na
+# ordem dos fatos, na ordem dos objetos, em comentarios ou no nome recebem o
+# mesmo hash. Fatos e objetos sao combinados por soma modular de digests
+# (independente de ordem e calculada em uma unica passada, sem ordenar);
+# o objetivo e normalizado (and/or achatados, filhos ordenados, dupla negacao
+# removida) antes de entrar no hash.
+#
+# A chave do ResultCache combina esse hash com o hash do conteudo do dominio
+# e com um namespace do job: o mesmo problema com outro dominio (ou um
+# dominio editado) ou com outro job nao reutiliza resultados.
+
+_MODULUS = 1 << 128
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest(), 'big')
+
+
+def _term(term) -> str:
+    if isinstance(term, (list, tuple)):
+        return '(' + ' '.join(_term(t) for t in term) + ')'
+    return str(term)
+
+
+def _normalize(expr):
+    if isinstance(expr, str) or not expr:
+        return expr if isinstance(expr, str) else ()
+    head = expr[0]
+    if head in ('and', 'or'):
+        children = {}
+        for sub in expr[1:]:
+            normalized = _normalize(sub)
+            # (and a (and b c)) == (and a b c)
+            parts = normalized[1:] if isinstance(normalized, tuple) and normalized[:1] == (head,) else [normalized]
+            for part in parts:
+                if part != ():
+                    children[_term(part)] = part
+        if len(children) == 1:
+            return next(iter(children.values()))
+        return (head,) + tuple(children[key] for key in sorted(children))
+    if head == 'not' and isinstance(expr[1], list) and expr[1][:1] == ['not']:
+        return _normalize(expr[1][1])
+    return tuple(_normalize(e) for e in expr)
+
+
+def canonical_goal(expr) -> str:
+    """Forma textual normalizada de uma formula de objetivo."""
+    return _term(_normalize(expr))
+
+
+def _multiset_hash(items) -> int:
+    total = 0
+    for item in items:
+        total = (total + _digest(item)) % _MODULUS
+    return total
+
+
+def problem_hash(problem: Problem) -> str:
+    objects = _multiset_hash(f"{name} - {_term(obj_type)}" for name, obj_type in problem.objects.items())
+    init = _multiset_hash(_term(fact) for fact in problem.init)
+    numeric = _multiset_hash(f"{_term(fluent)}={value!r}" for fluent, value in problem.numeric_init.items())
+    metric = '' if problem.metric is None else f"{problem.metric[0]} {_term(problem.metric[1])}"
+    summary = '|'.join([
+        str(problem.domain_name), f"{objects:032x}", f"{init:032x}", f"{numeric:032x}",
+        canonical_goal(problem.goal), metric,
+    ])
+    return hashlib.blake2b(summary.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _typed(items) -> str:
+    return ' '.join(sorted(f"{name} - {_term(item_type)}" for name, item_type in items))
+
+
+def domain_hash(domain: Domain) -> str:
+    """Hash do conteudo do dominio; a ordem das acoes e preservada."""
+    parts = [
+        str(domain.name), ' '.join(sorted(domain.requirements)),
+        _typed(domain.types.items()), _typed(domain.constants.items()),
+    ]
+    for signatures in (domain.predicates, domain.functions):
+        parts.append(' '.join(f"({name} {_typed(args)})" for name, args in sorted(signatures.items())))
+    for action in domain.actions:
+        parts.append(f"{action.name} ({_typed(action.parameters)}) "
+                     f"{_term(action.precondition)} {_term(action.effect)}")
+    return hashlib.blake2b('|'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def cache_key(problem_key: str, domain_key: str = '', namespace: str = '') -> str:
+    """Chave do ResultCache a partir de problem_hash, domain_hash e do namespace do job."""
+    summary = f"{namespace}|{domain_key}|{problem_key}"
+    return hashlib.blake2b(summary.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """Resultados (validacao, planejamento...) indexados por cache_key()."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.entries: Dict[str, object] = {}
+        self.hits = 0
+        if path is not None and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def get(self, key: str, default=None):
+        value = self.entries.get(key, default)
+        if key in self.entries:
+            self.hits += 1
+        return value
+
+    def put(self, key: str, value):
+        self.entries[key] = value
+
+    def get_or_compute(self, problem: Problem, compute: Callable[[Problem], object],
+                       domain: Optional[Domain] = None, namespace: str = ''):
+        key = cache_key(problem_hash(problem), domain_hash(domain) if domain is not None else '', namespace)
+        if key in self.entries:
+            self.hits += 1
+            return self.entries[key]
+        value = compute(problem)
+        self.entries[key] = value
+        return value
+
+    def save(self, path: Optional[str] = None):
+        path = path or self.path
+        if path is None:
+            raise RuntimeError("Erro de Cache: nenhum arquivo definido para salvar o cache")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
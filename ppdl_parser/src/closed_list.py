@@ -0,0 +1,233 @@
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+import time
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+# Lista fechada compacta para busca com memoria limitada.
+#
+# - Cada estado SAS+ e empacotado em poucos bytes (bits suficientes para o
+#   dominio de cada variavel) e guardado em um registro de tamanho fixo junto
+#   com o pai, o operador e o custo g.
+# - Registros ficam em segmentos; o indice de duplicatas e uma tabela hash de
+#   enderecamento aberto em arrays (id do estado + hash), sem guardar chaves.
+# - Quando a memoria passa do orcamento, os segmentos mais antigos ("frios")
+#   sao gravados em disco e substituidos por arquivos mapeados em memoria,
+#   cujas paginas o sistema operacional pode descartar. O indice (8 bytes
+#   por posicao: id e 32 bits do hash) permanece sempre em memoria.
+# - Memoria externa a lista (ex.: a lista aberta da busca) e informada por
+#   set_external_usage() e entra no orcamento. Se, mesmo apos despejar todos
+#   os segmentos possiveis, o uso continuar acima do orcamento, 'over_budget'
+#   passa a ser True e cabe ao chamador interromper o trabalho.
+
+_META = struct.Struct('<qii')  # pai, operador, g
+EMPTY = -1
+_HASH_MASK = 0xFFFFFFFF
+
+
+class StatePacker:
+    def __init__(self, domain_sizes: Sequence[int]):
+        self.shifts = []
+        self.masks = []
+        shift = 0
+        for size in domain_sizes:
+            bits = max(1, (size - 1).bit_length())
+            self.shifts.append(shift)
+            self.masks.append((1 << bits) - 1)
+            shift += bits
+        self.width = max(1, (shift + 7) // 8)
+
+    def pack(self, state: Sequence[int]) -> bytes:
+        value = 0
+        for shift, var_value in zip(self.shifts, state):
+            value |= var_value << shift
+        return value.to_bytes(self.width, 'little')
+
+    def unpack(self, packed: bytes) -> Tuple[int, ...]:
+        value = int.from_bytes(packed, 'little')
+        return tuple((value >> shift) & mask for shift, mask in zip(self.shifts, self.masks))
+
+
+class ClosedList:
+    def __init__(self, domain_sizes: Sequence[int], memory_budget: Optional[int] = None,
+                 segment_records: Optional[int] = None, spill_dir: Optional[str] = None):
+        self.packer = StatePacker(domain_sizes)
+        self.record_size = self.packer.width + _META.size
+        if segment_records is None:
+            # O segmento atual nunca e despejado: com orcamento, ele ocupa no maximo ~1/8 dele
+            segment_records = 1 << 16
+            if memory_budget is not None:
+                segment_records = max(256, min(segment_records, memory_budget // (8 * self.record_size)))
+        self.segment_records = segment_records
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self._spill_path: Optional[str] = None
+        # Segmentos: bytearray (em memoria) ou mmap (despejado em disco)
+        self.segments: List[object] = [bytearray()]
+        self.first_hot_segment = 0
+        self.size = 0
+        self._ids = array('i', [EMPTY]) * 1024
+        self._hashes = array('I', [0]) * 1024
+        self._mask = 1023
+        self.external_bytes = 0
+        self.over_budget = False
+
+        # Metricas
+        self.lookups = 0
+        self.lookup_time = 0.0
+        self.spilled_segments = 0
+        self.spilled_bytes = 0
+
+    def __len__(self):
+        return self.size
+
+    # -- registros ---------------------------------------------------------
+
+    def _record(self, state_id: int):
+        segment = self.segments[state_id // self.segment_records]
+        offset = (state_id % self.segment_records) * self.record_size
+        return segment, offset
+
+    def _packed_state(self, state_id: int) -> bytes:
+        segment, offset = self._record(state_id)
+        return bytes(segment[offset:offset + self.packer.width])
+
+    def state(self, state_id: int) -> Tuple[int, ...]:
+        return self.packer.unpack(self._packed_state(state_id))
+
+    def info(self, state_id: int) -> Tuple[int, int, int]:
+        """(pai, operador, g) do estado."""
+        segment, offset = self._record(state_id)
+        return _META.unpack_from(segment, offset + self.packer.width)
+
+    def trace(self, state_id: int) -> List[int]:
+        """Operadores do estado inicial ate state_id."""
+        operators = []
+        parent, op, _ = self.info(state_id)
+        while parent != EMPTY:
+            operators.append(op)
+            parent, op, _ = self.info(parent)
+        operators.reverse()
+        return operators
+
+    # -- indice ------------------------------------------------------------
+
+    def _find_slot(self, packed: bytes, key: int) -> int:
+        """'key' sao os 32 bits baixos do hash do estado empacotado."""
+        ids, hashes, mask = self._ids, self._hashes, self._mask
+        slot = key & mask
+        while True:
+            state_id = ids[slot]
+            if state_id == EMPTY or (hashes[slot] == key and self._packed_state(state_id) == packed):
+                return slot
+            slot = (slot + 1) & mask
+
+    def _grow_index(self):
+        old_ids, old_hashes = self._ids, self._hashes
+        capacity = len(old_ids) * 2
+        self._ids = array('i', [EMPTY]) * capacity
+        self._hashes = array('I', [0]) * capacity
+        self._mask = capacity - 1
+        for state_id, key in zip(old_ids, old_hashes):
+            if state_id != EMPTY:
+                slot = key & self._mask
+                while self._ids[slot] != EMPTY:
+                    slot = (slot + 1) & self._mask
+                self._ids[slot] = state_id
+                self._hashes[slot] = key
+
+    def lookup(self, state: Sequence[int]) -> int:
+        start = time.perf_counter()
+        packed = self.packer.pack(state)
+        state_id = self._ids[self._find_slot(packed, hash(packed) & _HASH_MASK)]
+        self.lookups += 1
+        self.lookup_time += time.perf_counter() - start
+        return state_id
+
+    def insert(self, state: Sequence[int], parent: int = EMPTY, operator: int = -1, g: int = 0) -> Tuple[int, bool]:
+        """Insere o estado se ainda nao existir. Retorna (id, novo)."""
+        start = time.perf_counter()
+        packed = self.packer.pack(state)
+        key = hash(packed) & _HASH_MASK
+        slot = self._find_slot(packed, key)
+        existing = self._ids[slot]
+        self.lookups += 1
+        self.lookup_time += time.perf_counter() - start
+        if existing != EMPTY:
+            return existing, False
+
+        state_id = self.size
+        if state_id // self.segment_records == len(self.segments):
+            self.segments.append(bytearray())
+        segment = self.segments[-1]
+        segment += packed
+        segment += _META.pack(parent, operator, g)
+        self.size += 1
+        self._ids[slot] = state_id
+        self._hashes[slot] = key
+        if self.size * 2 > len(self._ids):
+            self._grow_index()
+        if self.memory_budget is not None and self.size % 1024 == 0:
+            self._enforce_budget()
+        return state_id, True
+
+    # -- despejo em disco --------------------------------------------------
+
+    def index_bytes(self) -> int:
+        return self._ids.itemsize * len(self._ids) + self._hashes.itemsize * len(self._hashes)
+
+    def memory_usage(self) -> int:
+        hot = sum(len(s) for s in self.segments[self.first_hot_segment:])
+        return hot + self.index_bytes() + self.external_bytes
+
+    def set_external_usage(self, nbytes: int):
+        """Bytes usados fora da lista (ex.: lista aberta), contados no orcamento."""
+        self.external_bytes = nbytes
+
+    def _enforce_budget(self):
+        # O segmento atual (ultimo) nunca e despejado
+        while self.memory_usage() > self.memory_budget and self.first_hot_segment < len(self.segments) - 1:
+            self._spill(self.first_hot_segment)
+            self.first_hot_segment += 1
+        if not self.over_budget and self.memory_usage() > self.memory_budget:
+            self.over_budget = True
+            print(f"   [ClosedList]: Aviso: {self.memory_usage()} bytes em memória "
+                  f"(índice {self.index_bytes()}, externos {self.external_bytes}) excedem o "
+                  f"orçamento de {self.memory_budget} bytes mesmo após o despejo em disco.")
+
+    def _spill(self, index: int):
+        if self._spill_path is None:
+            self._spill_path = tempfile.mkdtemp(prefix='closed-list-', dir=self.spill_dir)
+        data = self.segments[index]
+        path = os.path.join(self._spill_path, f'segment-{index}.bin')
+        with open(path, 'wb') as f:
+            f.write(data)
+        # O mmap duplica o descritor: o arquivo pode ser fechado logo em seguida
+        with open(path, 'rb') as f:
+            self.segments[index] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.spilled_segments += 1
+        self.spilled_bytes += len(data)
+
+    def close(self):
+        for segment in self.segments:
+            if isinstance(segment, mmap.mmap):
+                segment.close()
+        if self._spill_path is not None:
+            shutil.rmtree(self._spill_path, ignore_errors=True)
+            self._spill_path = None
+
+    def stats(self) -> dict:
+        return {
+            'states': self.size,
+            'record_bytes': self.record_size,
+            'memory_bytes': self.memory_usage(),
+            'index_bytes': self.index_bytes(),
+            'over_budget': self.over_budget,
+            'spilled_segments': self.spilled_segments,
+            'spilled_bytes': self.spilled_bytes,
+            'lookups': self.lookups,
+            'avg_lookup_us': 1e6 * self.lookup_time / self.lookups if self.lookups else 0.0,
+        }
@@ -0,0 +1,422 @@
+from collections import defaultdict, deque
+from itertools import product
+from typing import Dict, List, Optional, Set, Tuple
+
+from .task import (NUMERIC_COMPARISONS, NUMERIC_EFFECTS, Task, is_variable,
+                   parse_typed_list)
+
+# Aterramento guiado por alcancabilidade relaxada, no estilo do tradutor do
+# Fast Downward: a tarefa e compilada em regras Datalog (ignorando efeitos de
+# remocao e condicoes negativas) e o modelo minimo e calculado por um ponto
+# fixo indexado. Somente as instancias de acao derivadas sao aterradas.
+
+TYPE_PREFIX = 'type@'
+ACTION_PREFIX = 'action@'
+
+
+class Rule:
+    def __init__(self, head: tuple, body: List[tuple]):
+        self.head = head
+        self.body = body
+
+    def __repr__(self):
+        return f"{self.head} :- {', '.join(map(str, self.body))}"
+
+
+class GroundAction:
+    def __init__(self, name: str, args: Tuple[str, ...], precondition: Tuple[tuple, ...],
+                 negative_precondition: Tuple[tuple, ...], add_effects: Tuple[tuple, ...],
+                 delete_effects: Tuple[tuple, ...], conditional_effects=(),
+                 numeric_preconditions=(), numeric_effects=(), condition=None):
+        self.name = name
+        self.args = args
+        self.precondition = precondition
+        self.negative_precondition = negative_precondition
+        self.add_effects = add_effects
+        self.delete_effects = delete_effects
+        # Lista de (condicao aterrada, adicoes, remocoes, efeitos numericos)
+        self.conditional_effects = conditional_effects
+        self.numeric_preconditions = numeric_preconditions
+        self.numeric_effects = numeric_effects
+        # Parte da precondicao que nao e uma conjuncao de literais (or, imply...)
+        self.condition = condition
+
+    @property
+    def full_name(self) -> str:
+        return f"({' '.join((self.name,) + self.args)})"
+
+    def __repr__(self):
+        return f"GroundAction{self.full_name}"
+
+
+class GroundTask:
+    def __init__(self, task: Task, atoms: Set[tuple], static_predicates: Set[str],
+                 actions: List[GroundAction], goal):
+        self.task = task
+        self.atoms = atoms
+        self.static_predicates = static_predicates
+        self.actions = actions
+        self.goal = goal
+        # Fatos estaticos sao removidos do estado: eles nunca mudam
+        self.init = frozenset(a for a in task.problem.init if a[0] not in static_predicates)
+
+
+# ---------------------------------------------------------------------------
+# Compilacao para Datalog
+# ---------------------------------------------------------------------------
+
+def _type_predicate(type_spec) -> str:
+    if isinstance(type_spec, tuple):
+        return TYPE_PREFIX + '(' + ' '.join(type_spec) + ')'
+    return TYPE_PREFIX + type_spec
+
+
+def _type_atoms(typed_vars) -> List[tuple]:
+    return [(_type_predicate(t), var) for var, t in typed_vars]
+
+
+def _relaxed_condition(expr) -> List[Tuple[List[tuple], List[tuple]]]:
+    """Forma disjuntiva relaxada: lista de (atomos positivos, variaveis tipadas extras)."""
+    if not expr:
+        return [([], [])]
+    head = expr[0]
+    if head == 'and':
+        alternatives = [([], [])]
+        for sub in expr[1:]:
+            alternatives = [(a1 + a2, v1 + v2)
+                            for a1, v1 in alternatives
+                            for a2, v2 in _relaxed_condition(sub)]
+        return alternatives
+    if head == 'or':
+        return [alt for sub in expr[1:] for alt in _relaxed_condition(sub)]
+    if head == 'exists':
+        typed_vars = parse_typed_list(expr[1])
+        return [(atoms, variables + typed_vars) for atoms, variables in _relaxed_condition(expr[2])]
+    if head in ('not', 'imply', 'forall') or head in NUMERIC_COMPARISONS:
+        # Relaxamento: condicoes negativas, universais e numericas sao tratadas como verdadeiras
+        return [([], [])]
+    return [([tuple(expr)], [])]
+
+
+def _relaxed_effects(expr) -> List[Tuple[tuple, List[tuple], List[tuple]]]:
+    """Lista de (atomo adicionado, condicao, variaveis tipadas extras)."""
+    if not expr:
+        return []
+    head = expr[0]
+    if head == 'and':
+        return [eff for sub in expr[1:] for eff in _relaxed_effects(sub)]
+    if head == 'forall':
+        typed_vars = parse_typed_list(expr[1])
+        return [(atom, cond, variables + typed_vars)
+                for atom, cond, variables in _relaxed_effects(expr[2])]
+    if head == 'when':
+        return [(atom, cond_atoms + cond, cond_vars + variables)
+                for cond_atoms, cond_vars in _relaxed_condition(expr[1])
+                for atom, cond, variables in _relaxed_effects(expr[2])]
+    if head == 'not' or head in NUMERIC_EFFECTS:
+        return []
+    return [(tuple(expr), [], [])]
+
+
+def compile_domain_rules(domain) -> Tuple[List[Rule], Set[object]]:
+    """Regras Datalog dos esquemas de acao; dependem apenas do dominio."""
+    type_specs = set()
+    rules = []
+    for action in domain.actions:
+        head = (ACTION_PREFIX + action.name,) + tuple(var for var, _ in action.parameters)
+        for atoms, extra_vars in _relaxed_condition(action.precondition):
+            body = _type_atoms(action.parameters) + _type_atoms(extra_vars) + atoms
+            rules.append(Rule(head, body))
+            type_specs.update(t for _, t in action.parameters + extra_vars)
+        for atom, cond_atoms, extra_vars in _relaxed_effects(action.effect):
+            rules.append(Rule(atom, [head] + _type_atoms(extra_vars) + cond_atoms))
+            type_specs.update(t for _, t in extra_vars)
+    return rules, type_specs
+
+
+class PreparedDomain:
+    """Pre-processamento do dominio reutilizavel por todos os problemas dele."""
+
+    def __init__(self, domain):
+        self.domain = domain
+        self.rules, self.type_specs = compile_domain_rules(domain)
+        self.changed_predicates = changed_predicates(domain)
+        self.schemas = {ACTION_PREFIX + a.name: a for a in domain.actions}
+        for type_name in domain.types:
+            domain.type_ancestors(type_name)
+
+
+def build_datalog_program(task: Task, prepared: Optional[PreparedDomain] = None) -> Tuple[Set[tuple], List[Rule]]:
+    if prepared is None:
+        prepared = PreparedDomain(task.domain)
+    facts = set(task.problem.init)
+    for type_spec in prepared.type_specs:
+        predicate = _type_predicate(type_spec)
+        facts.update((predicate, obj) for obj in task.objects_of_type(type_spec))
+    return facts, prepared.rules
+
+
+# ---------------------------------------------------------------------------
+# Ponto fixo indexado
+# ---------------------------------------------------------------------------
+
+def _unify(pattern: tuple, atom: tuple, binding: dict) -> Optional[dict]:
+    if len(pattern) != len(atom):
+        return None
+    new_binding = dict(binding)
+    for term, value in zip(pattern[1:], atom[1:]):
+        if is_variable(term):
+            bound = new_binding.get(term)
+            if bound is None:
+                new_binding[term] = value
+            elif bound != value:
+                return None
+        elif term != value:
+            return None
+    return new_binding
+
+
+def _join_plan(rule: Rule, trigger_index: int) -> List[Tuple[tuple, Tuple[int, ...]]]:
+    """Ordem gulosa de juncao: primeiro os atomos com mais argumentos ja ligados."""
+    bound = {t for t in rule.body[trigger_index][1:] if is_variable(t)}
+    remaining = [atom for i, atom in enumerate(rule.body) if i != trigger_index]
+    plan = []
+    while remaining:
+        def bound_count(atom):
+            return sum(1 for t in atom[1:] if not is_variable(t) or t in bound)
+        best = max(remaining, key=bound_count)
+        remaining.remove(best)
+        positions = tuple(i for i, t in enumerate(best[1:]) if not is_variable(t) or t in bound)
+        plan.append((best, positions))
+        bound.update(t for t in best[1:] if is_variable(t))
+    return plan
+
+
+def compute_model(facts: Set[tuple], rules: List[Rule]) -> Set[tuple]:
+    triggers = defaultdict(list)
+    # indexes[predicado][posicoes] -> {chave: [atomos]}
+    indexes: Dict[str, Dict[tuple, dict]] = defaultdict(dict)
+    model = set(facts)
+    queue = deque(model)
+
+    for rule in rules:
+        if not rule.body:
+            if rule.head not in model:
+                model.add(rule.head)
+                queue.append(rule.head)
+            continue
+        for i, atom in enumerate(rule.body):
+            plan = _join_plan(rule, i)
+            triggers[atom[0]].append((rule, atom, plan))
+            for step_atom, positions in plan:
+                indexes[step_atom[0]].setdefault(positions, defaultdict(list))
+
+    def join(plan, step, binding, head):
+        if step == len(plan):
+            derived = tuple(binding.get(t, t) for t in head)
+            if derived not in model:
+                model.add(derived)
+                queue.append(derived)
+            return
+        atom, positions = plan[step]
+        key = tuple(binding.get(atom[p + 1], atom[p + 1]) for p in positions)
+        for candidate in indexes[atom[0]][positions].get(key, ()):
+            new_binding = _unify(atom, candidate, binding)
+            if new_binding is not None:
+                join(plan, step + 1, new_binding, head)
+
+    while queue:
+        atom = queue.popleft()
+        # O atomo passa a ser "processado": entra nos indices antes das juncoes
+        for positions, index in indexes.get(atom[0], {}).items():
+            index[tuple(atom[p + 1] for p in positions)].append(atom)
+        for rule, pattern, plan in triggers.get(atom[0], ()):
+            binding = _unify(pattern, atom, {})
+            if binding is not None:
+                join(plan, 0, binding, rule.head)
+    return model
+
+
+# ---------------------------------------------------------------------------
+# Instanciacao das acoes alcancaveis
+# ---------------------------------------------------------------------------
+
+def changed_predicates(domain) -> Set[str]:
+    changed = set()
+
+    def collect(expr):
+        if not expr:
+            return
+        head = expr[0]
+        if head == 'and':
+            for sub in expr[1:]:
+                collect(sub)
+        elif head == 'forall':
+            collect(expr[2])
+        elif head == 'when':
+            collect(expr[2])
+        elif head == 'not':
+            collect(expr[1])
+        elif head not in NUMERIC_EFFECTS:
+            changed.add(head)
+
+    for action in domain.actions:
+        collect(action.effect)
+    return changed
+
+
+def static_predicates(task: Task, prepared: Optional[PreparedDomain] = None) -> Set[str]:
+    changed = prepared.changed_predicates if prepared is not None else changed_predicates(task.domain)
+    predicates = set(task.domain.predicates) | {atom[0] for atom in task.problem.init}
+    return predicates - changed
+
+
+def instantiate(expr, binding: dict, task: Task):
+    """Substitui variaveis e expande quantificadores sobre os objetos da tarefa."""
+    if isinstance(expr, str):
+        return binding.get(expr, expr)
+    if not expr:
+        return []
+    head = expr[0]
+    if head in ('forall', 'exists'):
+        typed_vars = parse_typed_list(expr[1])
+        domains = [task.objects_of_type(t) for _, t in typed_vars]
+        parts = []
+        for values in product(*domains):
+            inner = dict(binding)
+            inner.update(zip((v for v, _ in typed_vars), values))
+            parts.append(instantiate(expr[2], inner, task))
+        return ['and' if head == 'forall' else 'or'] + parts
+    return [instantiate(e, binding, task) for e in expr]
+
+
+def simplify_condition(expr, model: Set[tuple], statics: Set[str], init: Set[tuple]):
+    """Avalia o que ja e conhecido apos a analise: retorna True, False ou uma expressao."""
+    if not expr:
+        return True
+    head = expr[0]
+    if head in ('and', 'or'):
+        neutral, absorbing = (True, False) if head == 'and' else (False, True)
+        parts = []
+        for sub in expr[1:]:
+            value = simplify_condition(sub, model, statics, init)
+            if value is absorbing:
+                return absorbing
+            if value is neutral:
+                continue
+            if isinstance(value, list) and value and value[0] == head:
+                parts.extend(value[1:])
+            else:
+                parts.append(value)
+        if not parts:
+            return neutral
+        return parts[0] if len(parts) == 1 else [head] + parts
+    if head == 'not':
+        value = simplify_condition(expr[1], model, statics, init)
+        if isinstance(value, bool):
+            return not value
+        return ['not', value]
+    if head == 'imply':
+        return simplify_condition(['or', ['not', expr[1]], expr[2]], model, statics, init)
+    if head == '=' and all(isinstance(e, str) for e in expr[1:]):
+        return expr[1] == expr[2]
+    if head in NUMERIC_COMPARISONS:
+        return expr
+    atom = tuple(expr)
+    if atom not in model:
+        return False
+    if head in statics:
+        return atom in init
+    return expr
+
+
+def _split_condition(condition):
+    """Separa uma condicao simplificada em (positivos, negativos, numericos, resto)."""
+    positive, negative, numeric, rest = [], [], [], []
+    parts = condition[1:] if condition[0] == 'and' else [condition]
+    for part in parts:
+        if part[0] == 'not' and part[1][0] not in ('and', 'or', 'not') + NUMERIC_COMPARISONS:
+            negative.append(tuple(part[1]))
+        elif part[0] in NUMERIC_COMPARISONS:
+            numeric.append(part)
+        elif part[0] in ('or', 'not'):
+            rest.append(part)
+        else:
+            positive.append(tuple(part))
+    return positive, negative, numeric, rest
+
+
+def _ground_effects(expr, model, statics, init, add, delete, conditional, numeric):
+    if not expr:
+        return
+    head = expr[0]
+    if head == 'and':
+        for sub in expr[1:]:
+            _ground_effects(sub, model, statics, init, add, delete, conditional, numeric)
+    elif head == 'when':
+        condition = simplify_condition(expr[1], model, statics, init)
+        if condition is False:
+            return
+        if condition is True:
+            _ground_effects(expr[2], model, statics, init, add, delete, conditional, numeric)
+            return
+        cond_add, cond_delete, cond_numeric = [], [], []
+        _ground_effects(expr[2], model, statics, init, cond_add, cond_delete, conditional, cond_numeric)
+        conditional.append((condition, tuple(cond_add), tuple(cond_delete), tuple(cond_numeric)))
+    elif head == 'not':
+        atom = tuple(expr[1])
+        # Remover um atomo inalcancavel nao tem efeito
+        if atom in model:
+            delete.append(atom)
+    elif head in NUMERIC_EFFECTS:
+        numeric.append(expr)
+    else:
+        add.append(tuple(expr))
+
+
+def ground_action(task: Task, schema, args: Tuple[str, ...], model, statics) -> Optional[GroundAction]:
+    binding = dict(zip((var for var, _ in schema.parameters), args))
+    init = task.problem.init
+    condition = simplify_condition(instantiate(schema.precondition, binding, task), model, statics, init)
+    if condition is False:
+        return None
+    if condition is True:
+        positive, negative, numeric, rest = [], [], [], []
+    else:
+        positive, negative, numeric, rest = _split_condition(condition)
+
+    add, delete, conditional, numeric_effects = [], [], [], []
+    _ground_effects(instantiate(schema.effect, binding, task), model, statics, init,
+                    add, delete, conditional, numeric_effects)
+    return GroundAction(
+        schema.name, args, tuple(positive), tuple(negative), tuple(add),
+        tuple(a for a in delete if a not in add), tuple(conditional),
+        tuple(numeric), tuple(numeric_effects),
+        (['and'] + rest if len(rest) > 1 else rest[0]) if rest else None,
+    )
+
+
+def ground_task(task: Task, prepared: Optional[PreparedDomain] = None, verbose: bool = True) -> GroundTask:
+    if prepared is None:
+        prepared = PreparedDomain(task.domain)
+    facts, rules = build_datalog_program(task, prepared)
+    model = compute_model(facts, rules)
+    statics = static_predicates(task, prepared)
+    schemas = prepared.schemas
+
+    actions = []
+    for atom in sorted(model):
+        schema = schemas.get(atom[0])
+        if schema is None:
+            continue
+        action = ground_action(task, schema, atom[1:], model, statics)
+        if action is not None:
+            actions.append(action)
+
+    atoms = {atom for atom in model
+             if not atom[0].startswith((TYPE_PREFIX, ACTION_PREFIX)) and atom[0] not in statics}
+    goal = simplify_condition(instantiate(task.problem.goal, {}, task), model, statics,
+                              task.problem.init)
+    if verbose:
+        print(f"   [Grounding]: {len(atoms)} átomos alcançáveis, {len(actions)} ações aterradas.")
+    return GroundTask(task, atoms, statics, actions, goal)
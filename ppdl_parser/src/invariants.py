@@ -0,0 +1,188 @@
+from collections import deque
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from .grounding import GroundTask, static_predicates
+from .task import NUMERIC_EFFECTS, Task
+
+# Sintese de invariantes de exclusao mutua (grupos mutex) a partir dos
+# esquemas de acao, no estilo de Helmert (2009): cada invariante e um conjunto
+# de "partes" (predicado, posicoes contadas, posicao omitida) e afirma que,
+# para cada instancia dos parametros, no maximo um atomo das partes e
+# verdadeiro. Candidatos que nao sao balanceados por alguma acao sao
+# refinados com os atomos removidos por essa acao.
+
+# Parte: (predicado, posicoes dos argumentos contados, posicao omitida ou None)
+InvariantPart = Tuple[str, Tuple[int, ...], Optional[int]]
+Invariant = FrozenSet[InvariantPart]
+
+MAX_CANDIDATES = 1000
+
+
+def _literals(expr, adds, deletes, preconditions=None):
+    """Coleta literais de uma conjuncao. Retorna False se houver estruturas nao tratadas.
+
+    Nos efeitos, os literais aninhados em 'when'/'forall' tambem sao coletados
+    (a acao continua marcada como nao simples), para que nenhum atomo tocado
+    pela acao passe despercebido.
+    """
+    if not expr:
+        return True
+    head = expr[0]
+    if head == 'and':
+        # Sem curto-circuito: todos os literais precisam ser coletados
+        results = [_literals(sub, adds, deletes, preconditions) for sub in expr[1:]]
+        return all(results)
+    if head == 'not':
+        deletes.append(tuple(expr[1]))
+        return True
+    if preconditions is None:
+        if head in NUMERIC_EFFECTS:
+            return True
+        if head in ('when', 'forall'):
+            _literals(expr[2], adds, deletes)
+            return False
+    if head in ('when', 'forall', 'or', 'exists', 'imply') or head in NUMERIC_EFFECTS:
+        return False
+    adds.append(tuple(expr))
+    return True
+
+
+class _ActionInfo:
+    def __init__(self, schema):
+        self.name = schema.name
+        self.adds, self.deletes = [], []
+        self.simple = _literals(schema.effect, self.adds, self.deletes)
+        self.preconditions, ignored = [], []
+        _literals(schema.precondition, self.preconditions, ignored, preconditions=True)
+        self.deletes = [d for d in self.deletes if d not in self.adds]
+
+
+def _counted_args(part: InvariantPart, atom: tuple) -> tuple:
+    return tuple(atom[1 + p] for p in part[1])
+
+
+def _parts_by_predicate(invariant: Invariant) -> Dict[str, InvariantPart]:
+    return {part[0]: part for part in invariant}
+
+
+def _could_be_equal(args1: tuple, args2: tuple) -> bool:
+    for t1, t2 in zip(args1, args2):
+        if not t1.startswith('?') and not t2.startswith('?') and t1 != t2:
+            return False
+    return True
+
+
+def _touches(invariant_preds: Set[str], action: _ActionInfo) -> bool:
+    return any(a[0] in invariant_preds for a in action.adds + action.deletes)
+
+
+def _check_action(invariant: Invariant, action: _ActionInfo):
+    """Retorna (valido, lista de candidatos refinados).
+
+    Deve ser chamada apenas para acoes que tocam o invariante (_touches).
+    """
+    # Efeitos condicionais/universais nao sao analisados: a acao invalida o candidato
+    if not action.simple:
+        return False, []
+    parts = _parts_by_predicate(invariant)
+    added = [(a, parts[a[0]]) for a in action.adds if a[0] in parts]
+    if not added:
+        return True, []
+
+    # Dois atomos da mesma instancia adicionados pela mesma acao
+    for i in range(len(added)):
+        for j in range(i + 1, len(added)):
+            if _could_be_equal(_counted_args(added[i][1], added[i][0]),
+                               _counted_args(added[j][1], added[j][0])):
+                return False, []
+
+    for atom, part in added:
+        key = _counted_args(part, atom)
+        balanced = any(
+            d[0] in parts and _counted_args(parts[d[0]], d) == key and d in action.preconditions
+            for d in action.deletes
+        )
+        if balanced:
+            continue
+        refinements = []
+        for d in action.deletes:
+            if d[0] in parts or d not in action.preconditions:
+                continue
+            args = d[1:]
+            positions = []
+            for term in key:
+                if term not in args:
+                    break
+                positions.append(args.index(term))
+            else:
+                remaining = [p for p in range(len(args)) if p not in positions]
+                if len(remaining) <= 1:
+                    new_part = (d[0], tuple(positions), remaining[0] if remaining else None)
+                    refinements.append(invariant | {new_part})
+        return False, refinements
+    return True, []
+
+
+def _initial_candidates(task: Task, fluents: Set[str]) -> List[Invariant]:
+    candidates = []
+    for predicate in sorted(fluents):
+        arity = len(task.domain.predicates.get(predicate, []))
+        candidates.append(frozenset({(predicate, tuple(range(arity)), None)}))
+        for omitted in range(arity):
+            positions = tuple(p for p in range(arity) if p != omitted)
+            candidates.append(frozenset({(predicate, positions, omitted)}))
+    return candidates
+
+
+def find_invariants(task: Task, max_candidates: int = MAX_CANDIDATES, verbose: bool = True) -> List[Invariant]:
+    statics = static_predicates(task)
+    fluents = set(task.domain.predicates) - statics
+    actions = [_ActionInfo(schema) for schema in task.domain.actions]
+
+    queue = deque(_initial_candidates(task, fluents))
+    seen = set(queue)
+    invariants = []
+    while queue and len(seen) <= max_candidates:
+        candidate = queue.popleft()
+        preds = {part[0] for part in candidate}
+        valid = True
+        for action in actions:
+            if not _touches(preds, action):
+                continue
+            ok, refinements = _check_action(candidate, action)
+            if not ok:
+                valid = False
+                for refined in refinements:
+                    if refined not in seen:
+                        seen.add(refined)
+                        queue.append(refined)
+                break
+        if valid:
+            invariants.append(candidate)
+    if verbose:
+        print(f"   [Invariants]: {len(invariants)} invariantes encontrados "
+              f"({len(seen)} candidatos avaliados).")
+    return invariants
+
+
+def mutex_groups(ground_task: GroundTask, invariants: List[Invariant]) -> List[List[tuple]]:
+    """Instancia os invariantes sobre os atomos alcancaveis da tarefa aterrada."""
+    groups = []
+    seen = set()
+    for invariant in invariants:
+        parts = _parts_by_predicate(invariant)
+        instances: Dict[tuple, List[tuple]] = {}
+        # Ordem deterministica: nao depende da semente de hash das strings
+        for atom in sorted(ground_task.atoms):
+            part = parts.get(atom[0])
+            if part is not None:
+                instances.setdefault(_counted_args(part, atom), []).append(atom)
+        # O invariante precisa valer no estado inicial
+        if any(sum(1 for a in atoms if a in ground_task.init) > 1 for atoms in instances.values()):
+            continue
+        for atoms in instances.values():
+            group = frozenset(atoms)
+            if len(group) > 1 and group not in seen:
+                seen.add(group)
+                groups.append(sorted(atoms))
+    return groups
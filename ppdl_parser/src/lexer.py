@@ -1,93 +1,129 @@
-import re
-from enum import Enum, auto
-
-class TokenCode(Enum):
-    TOKEN_EMPTY = auto()
-    TOKEN_ERROR = auto()
-    TOKEN_IDENTIFIER = auto()
-    TOKEN_VAR_IDENTIFIER = auto()
-    TOKEN_NUMBER = auto()
-    TOKEN_EOF = auto()
-    TOKEN_COMMENTS = auto()
-    TOKEN_UNKNOWN = auto()
-
-    TOKEN_LPARENTHESIS = auto() 
-    TOKEN_RPARENTHESIS = auto()
-    TOKEN_COLON = auto()
-
-    TOKEN_DEFINE = auto()
-    TOKEN_DOMAIN = auto()
-    TOKEN_REQUIREMENTS = auto()
-    TOKEN_TYPES = auto()
-    TOKEN_CONSTANTS = auto()
-    TOKEN_PREDICATES = auto()
-    TOKEN_FUNCTIONS = auto()
-    TOKEN_CONSTRAINTS = auto()
-    TOKEN_ACTION = auto()
-    TOKEN_PARAMETERS = auto()
-    TOKEN_PRECONDITION = auto()
-    TOKEN_EFFECT = auto()
-    TOKEN_DURATIVE_ACTION = auto()
-    TOKEN_DURATION = auto()
-    TOKEN_CONDITION = auto()
-    TOKEN_DERIVED = auto()
-    TOKEN_PROBLEM = auto()
-    TOKEN_OBJECTS = auto()
-    TOKEN_INIT = auto()
-    TOKEN_GOAL = auto()
-    TOKEN_METRIC = auto()
-    TOKEN_TOTAL_TIME = auto()
-    TOKEN_LENGTH = auto()
-    TOKEN_SERIAL = auto()
-    TOKEN_PARALLEL = auto()
+# Codigos de token sao inteiros simples (e nao um Enum): comparacoes e buscas
+# em dicionario ficam mais baratas e o modulo carrega sem importar 'enum',
+# 're' ou 'typing', o que reduz o tempo de inicializacao do CLI.
+class TokenCode:
+    TOKEN_EMPTY = 0
+    TOKEN_ERROR = 1
+    TOKEN_IDENTIFIER = 2
+    TOKEN_VAR_IDENTIFIER = 3
+    TOKEN_NUMBER = 4
+    TOKEN_EOF = 5
+    TOKEN_COMMENTS = 6
+    TOKEN_UNKNOWN = 7
+
+    TOKEN_LPARENTHESIS = 8 
+    TOKEN_RPARENTHESIS = 9
+    TOKEN_COLON = 10
+
+    TOKEN_DEFINE = 11
+    TOKEN_DOMAIN = 12
+    TOKEN_REQUIREMENTS = 13
+    TOKEN_TYPES = 14
+    TOKEN_CONSTANTS = 15
+    TOKEN_PREDICATES = 16
+    TOKEN_FUNCTIONS = 17
+    TOKEN_CONSTRAINTS = 18
+    TOKEN_ACTION = 19
+    TOKEN_PARAMETERS = 20
+    TOKEN_PRECONDITION = 21
+    TOKEN_EFFECT = 22
+    TOKEN_DURATIVE_ACTION = 23
+    TOKEN_DURATION = 24
+    TOKEN_CONDITION = 25
+    TOKEN_DERIVED = 26
+    TOKEN_PROBLEM = 27
+    TOKEN_OBJECTS = 28
+    TOKEN_INIT = 29
+    TOKEN_GOAL = 30
+    TOKEN_METRIC = 31
+    TOKEN_TOTAL_TIME = 32
+    TOKEN_LENGTH = 33
+    TOKEN_SERIAL = 34
+    TOKEN_PARALLEL = 35
 
     # Operadores Lógicos (do primeiro código)
-    TOKEN_AND = auto()
-    TOKEN_OR = auto()
-    TOKEN_NOT = auto()
-    TOKEN_IMPLY = auto() # imply
+    TOKEN_AND = 36
+    TOKEN_OR = 37
+    TOKEN_NOT = 38
+    TOKEN_IMPLY = 39 # imply
 
     # Operadores Aritméticos e de Comparação (do primeiro código)
-    TOKEN_PLUS = auto()      # +
-    TOKEN_MINUS = auto()     # -
-    TOKEN_MULTIPLY = auto()  # *
-    TOKEN_DIVIDE = auto()    # /
-    TOKEN_LESS = auto()      # <
-    TOKEN_GREATER = auto()   # >
-    TOKEN_EQUAL = auto()     # = (já tinha, mas reforça)
-    TOKEN_LESS_EQUAL = auto()# <=
-    TOKEN_GREATER_EQUAL = auto()# >=
+    TOKEN_PLUS = 40      # +
+    TOKEN_MINUS = 41     # -
+    TOKEN_MULTIPLY = 42  # *
+    TOKEN_DIVIDE = 43    # /
+    TOKEN_LESS = 44      # <
+    TOKEN_GREATER = 45   # >
+    TOKEN_EQUAL = 46     # = (já tinha, mas reforça)
+    TOKEN_LESS_EQUAL = 47# <=
+    TOKEN_GREATER_EQUAL = 48# >=
 
     # Quantifiers (do primeiro código)
-    TOKEN_FORALL = auto()
-    TOKEN_EXISTS = auto()
+    TOKEN_FORALL = 49
+    TOKEN_EXISTS = 50
 
     # Operadores Condicionais (do primeiro código)
-    TOKEN_WHEN = auto() # when
+    TOKEN_WHEN = 51 # when
 
     # Operadores Modificadores (do primeiro código)
-    TOKEN_ASSIGN = auto()
-    TOKEN_SCALE_UP = auto()
-    TOKEN_SCALE_DOWN = auto()
-    TOKEN_INCREASE = auto()
-    TOKEN_DECREASE = auto()
+    TOKEN_ASSIGN = 52
+    TOKEN_SCALE_UP = 53
+    TOKEN_SCALE_DOWN = 54
+    TOKEN_INCREASE = 55
+    TOKEN_DECREASE = 56
 
     # Operadores Temporais (do primeiro código)
-    TOKEN_AT = auto()
-    TOKEN_OVER = auto()
-    TOKEN_START = auto()
-    TOKEN_END = auto()
+    TOKEN_AT = 57
+    TOKEN_OVER = 58
+    TOKEN_START = 59
+    TOKEN_END = 60
 
     # Operadores de Otimização (do primeiro código)
-    TOKEN_MINIMIZE = auto()
-    TOKEN_MAXIMIZE = auto()
+    TOKEN_MINIMIZE = 61
+    TOKEN_MAXIMIZE = 62
+
+
+# Tabela pre-calculada codigo -> nome, usada nas mensagens de erro
+TOKEN_NAMES = tuple(sorted((name for name in vars(TokenCode) if name.startswith('TOKEN_')),
+                           key=lambda name: getattr(TokenCode, name)))
+
+
+def token_name(code: int) -> str:
+    return TOKEN_NAMES[code]
 
 
 class Token:
-    def __init__(self, content: str, code: TokenCode, line_num: int):
+    def __init__(self, content: str, code: int, line_num: int, symbol_id: int = -1):
         self.content = content
         self.code = code
         self.line_num = line_num
+        # Id inteiro do simbolo (identificadores e variaveis); -1 para os demais tokens
+        self.symbol_id = symbol_id
+
+
+class SymbolTable:
+    """Tabela de simbolos: cada nome distinto e guardado uma unica vez e recebe um id denso."""
+
+    def __init__(self):
+        self.ids: dict = {}
+        self.names: list = []
+
+    def intern(self, name: str) -> tuple:
+        symbol_id = self.ids.get(name)
+        if symbol_id is None:
+            symbol_id = len(self.names)
+            self.ids[name] = symbol_id
+            self.names.append(name)
+        return self.names[symbol_id], symbol_id
+
+    def name(self, symbol_id: int) -> str:
+        return self.names[symbol_id]
+
+    def __len__(self):
+        return len(self.names)
+
+
+_ASCII_LETTERS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
 
 # Listas de palavras-chave e operadores para ajudar o lexer a classificar
 # Mapeamos a string para o TokenCode correspondente para facilitar a busca
@@ -132,10 +168,13 @@ SINGLE_CHAR_OPERATORS = {
 }
 
 class Lexer:
-    def __init__(self, source_code: str):
+    def __init__(self, source_code: str, symbol_table: SymbolTable = None):
         self.source_code = source_code
         self.position = 0
         self.current_line = 1
+        # Cada Lexer tem sua propria tabela; para que dominio e problemas usem
+        # os mesmos ids, passe a mesma SymbolTable a todos eles
+        self.symbols = symbol_table if symbol_table is not None else SymbolTable()
 
     def peek(self, offset=0) -> str:
         if self.position + offset < len(self.source_code):
@@ -239,8 +278,10 @@ class Lexer:
             # Se o token começa com '?', é uma variável
             if atom.startswith('?'):
                 # Podemos adicionar uma validação mais robusta de variável se necessário
-                if re.fullmatch(r'^\?[a-zA-Z][\w-]*$', atom): # Do primeiro código
-                    return Token(atom, TokenCode.TOKEN_VAR_IDENTIFIER, self.current_line)
+                # Equivale a r'^\?[a-zA-Z][\w-]*$' sobre os caracteres já aceitos acima
+                if len(atom) > 1 and atom[1] in _ASCII_LETTERS and '?' not in atom[2:]:
+                    name, symbol_id = self.symbols.intern(atom)
+                    return Token(name, TokenCode.TOKEN_VAR_IDENTIFIER, self.current_line, symbol_id)
                 else:
                     return Token(atom, TokenCode.TOKEN_UNKNOWN, self.current_line)
             
@@ -250,8 +291,9 @@ class Lexer:
             
             # Se não for palavra-chave nem variável, é um identificador normal
             # Do primeiro código, regex para identificadores normais: r'^[a-zA-Z][\w-]*$'
-            if re.fullmatch(r'^[a-zA-Z][\w-]*$', atom):
-                return Token(atom, TokenCode.TOKEN_IDENTIFIER, self.current_line)
+            if atom[0] in _ASCII_LETTERS and '?' not in atom:
+                name, symbol_id = self.symbols.intern(atom)
+                return Token(name, TokenCode.TOKEN_IDENTIFIER, self.current_line, symbol_id)
             
             # Se não se encaixa em nada, ainda pode ser um UNKNOWN
             return Token(atom, TokenCode.TOKEN_UNKNOWN, self.current_line)
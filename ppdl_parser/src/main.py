@@ -1,23 +1,28 @@
 import sys
-import os
-from .ast import parse_file_to_ast
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Os modulos do analisador sao importados sob demanda dentro de cada funcao:
+# 'import src.main' fica barato e so paga pelo lexer/parser ou pelo construtor
+# de AST quem de fato os usa (ver bench_importtime.py).
 
-from src.parser import Parser
-from src.lexer import Lexer, TokenCode
+def analyze_pddl_file(file_path: str, symbol_table=None):
+    """Analisa um arquivo e retorna o Parser em caso de sucesso (None caso contrario).
+
+    Passe a mesma SymbolTable ao dominio e ao problema para que os ids dos
+    nomes sejam comparaveis entre os dois arquivos.
+    """
+    from .parser import Parser
 
-def analyze_pddl_file(file_path: str):
     print(f"\n--- Analisando Arquivo: {file_path} ---")
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             source_code = f.read()
         
-        parser = Parser(source_code)
+        parser = Parser(source_code, symbol_table)
         success = parser.parse() 
 
         if success:
             print(f"SUCESSO: {file_path} está sintaticamente correto.")
+            return parser
         else:
             print(f"FALHA: {file_path} contém erros sintáticos.")
         
@@ -29,6 +34,8 @@ def analyze_pddl_file(file_path: str):
         print(f"OCORREU UM ERRO INESPERADO: {e}")
 
 def parse_to_ast(domain_path, problem_path):
+    from .ast import parse_file_to_ast
+
     domain_ast = parse_file_to_ast(domain_path)
     problem_ast = parse_file_to_ast(problem_path)
     return domain_ast, problem_ast
@@ -44,10 +51,20 @@ if __name__ == "__main__":
         else:
             problem_file = None
 
-    analyze_pddl_file(domain_file)
+    from .lexer import SymbolTable
+
+    # Uma tabela por par dominio/problema: o ':domain' do problema e o nome
+    # do dominio recebem o mesmo id se forem o mesmo nome
+    symbols = SymbolTable()
+    domain_parser = analyze_pddl_file(domain_file, symbols)
     
     if problem_file:
         print("\n" + "="*60 + "\n")
-        analyze_pddl_file(problem_file)
+        problem_parser = analyze_pddl_file(problem_file, symbols)
+        if domain_parser is not None and problem_parser is not None \
+                and domain_parser.domain_id != problem_parser.domain_id:
+            print(f"AVISO: {problem_file} referencia o domínio "
+                  f"'{symbols.name(problem_parser.domain_id)}', mas {domain_file} define "
+                  f"'{symbols.name(domain_parser.domain_id)}'.")
     
     print("\n--- Todos os arquivos PDDL analisados! ---")
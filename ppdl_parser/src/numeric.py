@@ -0,0 +1,260 @@
+import math
+from array import array
+from typing import Callable, Dict, List, Optional
+
+from .grounding import GroundTask
+from .task import NUMERIC_COMPARISONS
+
+# Compilacao de expressoes numericas (':functions', '(= (f ...) v)',
+# 'increase'/'decrease'/'assign'/'scale-up'/'scale-down' e ':metric').
+# Cada expressao e traduzida uma unica vez para codigo Python e compilada;
+# os valores dos fluentes ficam em um array('d') indexado pelo id do fluente,
+# de modo que avaliar uma precondicao ou aplicar um efeito nao percorre a AST.
+
+ARITHMETIC_OPERATORS = ('+', '-', '*', '/')
+UNDEFINED = float('nan')
+
+# Comandos sobre a copia 'w'; os lados direitos leem sempre o estado antigo
+# 'v', e varios 'increase'/'decrease' sobre o mesmo fluente se acumulam.
+_EFFECT_TEMPLATES = {
+    'assign': 'w[{index}] = {value}',
+    'increase': 'w[{index}] += {value}',
+    'decrease': 'w[{index}] -= {value}',
+    'scale-up': 'w[{index}] = v[{index}] * {value}',
+    'scale-down': 'w[{index}] = v[{index}] / {value}',
+}
+
+
+# repr(float) de literais como '1e400' ou 'nan' gera os nomes 'inf'/'nan'
+_CODE_GLOBALS = {'inf': math.inf, 'nan': math.nan}
+
+
+class FluentTable:
+    """Mapeia cada fluente aterrado, ex. ('intensidade', 'quarto'), para um indice."""
+
+    def __init__(self):
+        self.index: Dict[tuple, int] = {}
+        self.fluents: List[tuple] = []
+
+    def get(self, fluent: tuple) -> int:
+        idx = self.index.get(fluent)
+        if idx is None:
+            idx = len(self.fluents)
+            self.index[fluent] = idx
+            self.fluents.append(fluent)
+        return idx
+
+    def __len__(self):
+        return len(self.fluents)
+
+
+def _is_number(term: str) -> bool:
+    try:
+        float(term)
+        return True
+    except ValueError:
+        return False
+
+
+def expression_source(expr, table: FluentTable) -> str:
+    if isinstance(expr, str):
+        if _is_number(expr):
+            return repr(float(expr))
+        raise RuntimeError(f"Erro Numérico: termo '{expr}' não é um número nem um fluente")
+    if not expr:
+        raise RuntimeError("Erro Numérico: expressão vazia")
+    head = expr[0]
+    if head in ARITHMETIC_OPERATORS and len(expr) > 1 and not (head == '-' and len(expr) == 2):
+        operands = [expression_source(e, table) for e in expr[1:]]
+        return '(' + f' {head} '.join(operands) + ')'
+    if head == '-' and len(expr) == 2:
+        return f"(-{expression_source(expr[1], table)})"
+    if head == 'total-time':
+        raise RuntimeError("Erro Numérico: 'total-time' não é suportado em tarefas sem duração")
+    return f"v[{table.get(tuple(expr))}]"
+
+
+def condition_source(expr, table: FluentTable) -> str:
+    head = expr[0]
+    if head not in NUMERIC_COMPARISONS:
+        raise RuntimeError(f"Erro Numérico: comparação inválida '{head}'")
+    op = '==' if head == '=' else head
+    return f"({expression_source(expr[1], table)} {op} {expression_source(expr[2], table)})"
+
+
+def state_condition_source(expr, table: FluentTable) -> str:
+    """Condicao aterrada sobre o estado proposicional 's' e os fluentes 'v'."""
+    if expr is True or expr is False:
+        return repr(expr)
+    head = expr[0]
+    if head in ('and', 'or'):
+        return '(' + f' {head} '.join(state_condition_source(e, table) for e in expr[1:]) + ')'
+    if head == 'not':
+        return f"(not {state_condition_source(expr[1], table)})"
+    if head == 'imply':
+        return (f"(not {state_condition_source(expr[1], table)} or "
+                f"{state_condition_source(expr[2], table)})")
+    if head in NUMERIC_COMPARISONS:
+        return condition_source(expr, table)
+    if head in ('exists', 'forall', 'when'):
+        raise RuntimeError(f"Erro Numérico: '{head}' não pode ser compilado em uma condição aterrada")
+    return f"({tuple(expr)!r} in s)"
+
+
+def _has_comparison(expr) -> bool:
+    if expr is True or expr is False or expr is None:
+        return False
+    if expr[0] in NUMERIC_COMPARISONS:
+        return True
+    return expr[0] in ('and', 'or', 'not', 'imply') and any(_has_comparison(e) for e in expr[1:])
+
+
+def _mentions_atoms(expr) -> bool:
+    if expr is True or expr is False or expr[0] in NUMERIC_COMPARISONS:
+        return False
+    if expr[0] in ('and', 'or', 'not', 'imply'):
+        return any(_mentions_atoms(e) for e in expr[1:])
+    return True
+
+
+def _compile(source: str, name: str):
+    return eval(compile(source, f'<numeric {name}>', 'eval'), dict(_CODE_GLOBALS))
+
+
+def compile_expression(expr, table: FluentTable) -> Callable[[array], float]:
+    return _compile(f"lambda v: {expression_source(expr, table)}", 'expression')
+
+
+def compile_conditions(conditions, table: FluentTable) -> Optional[Callable[[array], bool]]:
+    """Conjuncao de comparacoes em uma unica funcao; None se nao houver condicoes."""
+    if not conditions:
+        return None
+    body = ' and '.join(condition_source(c, table) for c in conditions)
+    return _compile(f"lambda v: {body}", 'condition')
+
+
+def compile_state_conditions(conditions, table: FluentTable) -> Optional[Callable[..., bool]]:
+    """Conjuncao de condicoes com 'and'/'or'/'not'/'imply' sobre 'v' e 's'.
+
+    O estado proposicional 's' so e exigido se alguma condicao citar atomos.
+    """
+    if not conditions:
+        return None
+    lines = ["def check(v, s=None):"]
+    if any(_mentions_atoms(c) for c in conditions):
+        lines.append("    if s is None:")
+        lines.append("        raise RuntimeError('Erro Numérico: a condição cita átomos e "
+                     "exige o estado proposicional')")
+    body = ' and '.join(state_condition_source(c, table) for c in conditions)
+    lines.append(f"    return {body}")
+    namespace = dict(_CODE_GLOBALS)
+    exec(compile('\n'.join(lines), '<numeric condition>', 'exec'), namespace)
+    return namespace['check']
+
+
+def _statement(effect, table: FluentTable) -> str:
+    op, fluent, value = effect
+    template = _EFFECT_TEMPLATES.get(op)
+    if template is None:
+        raise RuntimeError(f"Erro Numérico: efeito '{op}' desconhecido")
+    return template.format(index=table.get(tuple(fluent)), value=expression_source(value, table))
+
+
+def compile_effects(effects, table: FluentTable, conditional=()) -> Optional[Callable[..., array]]:
+    """Efeitos simultaneos: todos os lados direitos sao avaliados no estado antigo.
+
+    'conditional' e uma lista de (condicao aterrada, efeitos numericos); a
+    funcao gerada entao recebe tambem o estado proposicional 's' (conjunto de
+    atomos verdadeiros), no qual as condicoes sao avaliadas.
+    """
+    conditional = [(condition, numeric) for condition, numeric in conditional if numeric]
+    if not effects and not conditional:
+        return None
+    lines = ["def apply(v, s=None):"]
+    if conditional:
+        lines.append("    if s is None:")
+        lines.append("        raise RuntimeError('Erro Numérico: efeitos numéricos condicionais "
+                     "exigem o estado proposicional')")
+    lines.append("    w = v[:]")
+    lines += [f"    {_statement(effect, table)}" for effect in effects]
+    for condition, numeric in conditional:
+        # Condicoes tambem sao avaliadas no estado antigo
+        lines.append(f"    if {state_condition_source(condition, table)}:")
+        lines += [f"        {_statement(effect, table)}" for effect in numeric]
+    lines.append("    return w")
+    namespace = dict(_CODE_GLOBALS)
+    exec(compile('\n'.join(lines), '<numeric effect>', 'exec'), namespace)
+    return namespace['apply']
+
+
+class NumericTask:
+    def __init__(self, table: FluentTable, init: array, preconditions: list, effects: list,
+                 goal: Optional[Callable], metric: Optional[Callable], minimize: bool = True):
+        self.table = table
+        self.init = init
+        # preconditions[i] / effects[i] correspondem a ground_task.actions[i]
+        self.preconditions = preconditions
+        self.effects = effects
+        self.goal = goal
+        self.metric = metric
+        self.minimize = minimize
+
+    def applicable(self, action_index: int, values: array, state=None) -> bool:
+        """'state' so e exigido se a precondicao misturar atomos e comparacoes."""
+        check = self.preconditions[action_index]
+        return check is None or check(values, state)
+
+    def apply(self, action_index: int, values: array, state=None) -> array:
+        """'state' (atomos verdadeiros) so e exigido por efeitos numericos condicionais."""
+        apply = self.effects[action_index]
+        return values if apply is None else apply(values, state)
+
+    def plan_cost(self, plan: List[int], states=None) -> float:
+        """Valor da metrica apos executar o plano (indices de acoes aterradas).
+
+        'states[i]' e o estado proposicional antes da i-esima acao do plano.
+        """
+        values = self.init
+        for step, action_index in enumerate(plan):
+            values = self.apply(action_index, values, states[step] if states is not None else None)
+        if self.metric is None:
+            return float(len(plan))
+        return self.metric(values)
+
+
+def _numeric_parts(condition) -> list:
+    """Partes de uma conjuncao que contem comparacoes, inclusive sob 'or'/'not'/'imply'.
+
+    Partes puramente proposicionais ficam a cargo da tarefa SAS+/STRIPS.
+    """
+    if condition is True or condition is False or condition is None:
+        return []
+    parts = condition[1:] if condition[0] == 'and' else [condition]
+    return [p for p in parts if _has_comparison(p)]
+
+
+def compile_numeric_task(ground_task: GroundTask) -> NumericTask:
+    table = FluentTable()
+    problem = ground_task.task.problem
+    for fluent in problem.numeric_init:
+        table.get(fluent)
+
+    preconditions, effects = [], []
+    for action in ground_task.actions:
+        conditions = list(action.numeric_preconditions) + _numeric_parts(action.condition)
+        preconditions.append(compile_state_conditions(conditions, table))
+        conditional = [(condition, numeric) for condition, _, _, numeric in action.conditional_effects]
+        effects.append(compile_effects(action.numeric_effects, table, conditional))
+    goal = compile_state_conditions(_numeric_parts(ground_task.goal), table)
+
+    metric, minimize = None, True
+    if problem.metric is not None:
+        direction, expr = problem.metric
+        minimize = direction == 'minimize'
+        metric = compile_expression(expr, table)
+
+    # Fluentes sem valor inicial permanecem indefinidos (NaN torna comparacoes falsas)
+    init = array('d', [UNDEFINED] * len(table))
+    for fluent, value in problem.numeric_init.items():
+        init[table.index[fluent]] = value
+    return NumericTask(table, init, preconditions, effects, goal, metric, minimize)
@@ -0,0 +1,179 @@
+import os
+import re
+import sys
+from typing import List, Optional, Tuple
+
+from .workers import uses_fork, worker_pool, worker_state
+
+# Front-end paralelo para um unico arquivo PDDL muito grande.
+#
+# 1. Uma pre-varredura rapida (so parenteses e comentarios) encontra as
+#    secoes de nivel superior do 'define' ((:objects, (:init, (:goal, ...) e,
+#    dentro de secoes grandes, pontos de corte seguros entre fatos.
+# 2. Cada trecho e tokenizado com a mesma gramatica de src/ast.py (tokenize)
+#    e convertido para a mesma AST em listas em um pool de processos.
+# 3. Os resultados sao reunidos na ordem original.
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+_SCAN_PATTERN = re.compile(r'[()]|;[^\n]*')
+_SECTION_KEYWORD = re.compile(r'\(\s*([^\s();]+)')
+# Equivale a ast.tokenize: comentarios descartados, '(' / ')' e atomos
+_TOKEN_PATTERN = re.compile(r';[^\n]*|[()]|[^\s();]+')
+
+
+class Section:
+    def __init__(self, start: int, end: int):
+        self.start = start
+        self.end = end
+        # Offsets logo apos o ')' de um fato de nivel 3, espacados de ~chunk_size
+        self.split_points: List[int] = []
+
+
+def prescan(source: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[List[Tuple[int, int]], List[Section]]:
+    """Retorna (formas de nivel 0, secoes filhas do 'define' com pontos de corte)."""
+    top_level = []
+    sections = []
+    depth = 0
+    top_start = section = None
+    last_split = 0
+    for match in _SCAN_PATTERN.finditer(source):
+        char = match.group()
+        if char == '(':
+            if depth == 0:
+                top_start = match.start()
+            elif depth == 1:
+                section = Section(match.start(), -1)
+                last_split = match.start()
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth < 0:
+                line = source.count('\n', 0, match.start()) + 1
+                raise RuntimeError(f"Erro de Sintaxe: ')' sem '(' correspondente na linha {line}")
+            if depth == 0:
+                top_level.append((top_start, match.end()))
+            elif depth == 1:
+                section.end = match.end()
+                sections.append(section)
+            elif depth == 2 and match.end() - last_split >= chunk_size:
+                section.split_points.append(match.end())
+                last_split = match.end()
+    if depth != 0:
+        raise RuntimeError("Erro de Sintaxe: parênteses não fechados ao final do arquivo")
+    return top_level, sections
+
+
+def lex_and_parse(text: str, first_line: int = 1) -> list:
+    """Tokeniza um trecho como ast.tokenize e monta as formas na AST em listas.
+
+    'first_line' (linha do trecho no arquivo original) so e usada nas mensagens de erro.
+    """
+    stack: List[list] = [[]]
+    open_offsets: List[int] = []
+    for match in _TOKEN_PATTERN.finditer(text):
+        token = match.group()
+        if token == '(':
+            stack.append([])
+            open_offsets.append(match.start())
+        elif token == ')':
+            if len(stack) == 1:
+                line = first_line + text.count('\n', 0, match.start())
+                raise RuntimeError(f"Erro de Sintaxe: ')' sem '(' correspondente na linha {line}")
+            form = stack.pop()
+            open_offsets.pop()
+            stack[-1].append(form)
+        elif token[0] != ';':
+            stack[-1].append(sys.intern(token))
+    if len(stack) != 1:
+        line = first_line + text.count('\n', 0, open_offsets[-1])
+        raise RuntimeError(f"Erro de Sintaxe: '(' aberto na linha {line} não foi fechado")
+    return stack[0]
+
+
+def _run_job(job) -> list:
+    text, start, end, first_line = job
+    if text is None:
+        text = worker_state()['source'][start:end]
+    return lex_and_parse(text, first_line)
+
+
+def parse_source_parallel(source: str, processes: Optional[int] = None,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> list:
+    """Mesma AST de ast.parse_file_to_ast, mas com os trechos analisados em paralelo."""
+    top_level, sections = prescan(source, chunk_size)
+    # Com 'fork' os processos herdam o texto completo; sem ele, cada job leva
+    # o proprio trecho (serializar o arquivo inteiro por processo custaria mais)
+    forking = uses_fork()
+
+    # Cada job: (texto ou None, inicio, fim, linha inicial)
+    jobs = []
+    # plan: ('form', job) | ('define', job do cabecalho, [(palavra-chave ou None, [jobs])])
+    plan = []
+
+    def add_job(start, end):
+        text = None if forking else source[start:end]
+        jobs.append([text, start, end, 0])
+        return len(jobs) - 1
+
+    section_iter = iter(sections)
+    pending = next(section_iter, None)
+    for top_start, top_end in top_level:
+        children = []
+        head_end = top_end
+        while pending is not None and pending.start < top_end:
+            head_end = min(head_end, pending.start)
+            keyword_match = _SECTION_KEYWORD.match(source, pending.start)
+            if pending.split_points and keyword_match:
+                body_start = keyword_match.end()
+                bounds = [body_start] + pending.split_points + [pending.end - 1]
+                chunk_jobs = [add_job(a, b) for a, b in zip(bounds, bounds[1:])]
+                children.append((keyword_match.group(1), chunk_jobs))
+            else:
+                children.append((None, [add_job(pending.start, pending.end)]))
+            pending = next(section_iter, None)
+        if children:
+            plan.append(('define', add_job(top_start + 1, head_end), children))
+        else:
+            plan.append(('form', add_job(top_start, top_end)))
+
+    # Linhas iniciais calculadas de forma incremental, em ordem de offset
+    line, offset = 1, 0
+    for job in sorted(jobs, key=lambda j: j[1]):
+        line += source.count('\n', offset, job[1])
+        offset = job[1]
+        job[3] = line
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(jobs) <= 1 or len(source) < chunk_size:
+        for job in jobs:
+            job[0] = job[0] if job[0] is not None else source[job[1]:job[2]]
+        results = [_run_job(job) for job in jobs]
+    else:
+        with worker_pool(processes, **({'source': source} if forking else {})) as pool:
+            results = pool.map(_run_job, jobs, chunksize=1)
+
+    ast = []
+    for entry in plan:
+        if entry[0] == 'form':
+            ast.extend(results[entry[1]])
+            continue
+        _, head_job, children = entry
+        define_form = list(results[head_job])
+        for keyword, chunk_jobs in children:
+            if keyword is None:
+                define_form.extend(results[chunk_jobs[0]])
+            else:
+                section_form = [keyword]
+                for job_index in chunk_jobs:
+                    section_form.extend(results[job_index])
+                define_form.append(section_form)
+        ast.append(define_form)
+    return ast
+
+
+def parse_file_parallel(path: str, processes: Optional[int] = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE) -> list:
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    return parse_source_parallel(source, processes, chunk_size)
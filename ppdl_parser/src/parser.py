@@ -1,17 +1,19 @@
-from typing import List, Tuple
-from .lexer import Token, TokenCode, Lexer
-import sys
+from .lexer import Token, TokenCode, Lexer, SymbolTable, token_name
 
 class Parser:
-    def __init__(self, source_code: str):
-        self.lexer = Lexer(source_code)
+    def __init__(self, source_code: str, symbol_table: SymbolTable = None):
+        self.lexer = Lexer(source_code, symbol_table)
         self.current_token = self.lexer.get_next_token()
+        # Id do nome do dominio definido (ou referenciado em ':domain' por um
+        # problema); com uma SymbolTable compartilhada, dominio e problema
+        # sao comparados pelo id
+        self.domain_id = -1
 
-    def check_token(self, expected_token_code: TokenCode):
+    def check_token(self, expected_token_code: int):
         if self.current_token.code != expected_token_code:
             raise RuntimeError(
-                f"Erro de Sintaxe: Esperava {expected_token_code.name} "
-                f"mas encontrou '{self.current_token.content}' ({self.current_token.code.name}) "
+                f"Erro de Sintaxe: Esperava {token_name(expected_token_code)} "
+                f"mas encontrou '{self.current_token.content}' ({token_name(self.current_token.code)}) "
                 f"na linha {self.current_token.line_num}"
             )
         self.next_token()
@@ -57,6 +59,7 @@ class Parser:
         self.check_token(TokenCode.TOKEN_DOMAIN)
         print("   [Parser]: Encontrou palavra-chave 'domain'.")
         domain_name = self.current_token.content
+        self.domain_id = self.current_token.symbol_id
         self.check_token(TokenCode.TOKEN_IDENTIFIER)
         print(f"   [Parser]: Nome do domínio: '{domain_name}'.")
         self.check_token(TokenCode.TOKEN_RPARENTHESIS)
@@ -78,6 +81,7 @@ class Parser:
         self.check_token(TokenCode.TOKEN_COLON)
         self.check_token(TokenCode.TOKEN_DOMAIN)
         associated_domain_name = self.current_token.content
+        self.domain_id = self.current_token.symbol_id
         self.check_token(TokenCode.TOKEN_IDENTIFIER)
         self.check_token(TokenCode.TOKEN_RPARENTHESIS)
         print(f"   [Parser]: Encontrou seção ':domain' referenciando '{associated_domain_name}'.")
@@ -160,7 +164,7 @@ class Parser:
             self.next_token()
             current_types_group.append(type_name)
             
-            if self.current_token.content == '-':
+            if self.current_token.code == TokenCode.TOKEN_MINUS:
                 self.next_token()
                 parent_type_name = self.current_token.content
                 self.check_token(TokenCode.TOKEN_IDENTIFIER)
@@ -179,7 +183,7 @@ class Parser:
             self.next_token()
             current_constants_group.append(const_name)
 
-            if self.current_token.content == '-':
+            if self.current_token.code == TokenCode.TOKEN_MINUS:
                 self.next_token()
                 const_type_name = self.current_token.content
                 self.check_token(TokenCode.TOKEN_IDENTIFIER)
@@ -211,7 +215,7 @@ class Parser:
             self.check_token(TokenCode.TOKEN_RPARENTHESIS)
             
             return_type = "number"
-            if self.current_token.content == '-':
+            if self.current_token.code == TokenCode.TOKEN_MINUS:
                 self.next_token()
                 return_type = self.current_token.content
                 self.check_token(TokenCode.TOKEN_IDENTIFIER)
@@ -266,7 +270,7 @@ class Parser:
             self.next_token()
             current_objects_group.append(obj_name)
             
-            if self.current_token.content == '-':
+            if self.current_token.code == TokenCode.TOKEN_MINUS:
                 self.next_token()
                 obj_type_name = self.current_token.content
                 self.check_token(TokenCode.TOKEN_IDENTIFIER)
@@ -336,13 +340,13 @@ class Parser:
         print(f"       [Parser]: Métrica definida como '{metric_type}'.")
         self.parse_expression("metric expression")
 
-    def parse_parameters(self) -> List[Tuple[str, str]]:
+    def parse_parameters(self) -> list:
         params_info = []
         while self.current_token.code == TokenCode.TOKEN_VAR_IDENTIFIER:
             var_name = self.current_token.content
             self.next_token()
             param_type = "object"
-            if self.current_token.content == '-':
+            if self.current_token.code == TokenCode.TOKEN_MINUS:
                 self.next_token()
                 param_type = self.current_token.content
                 self.check_token(TokenCode.TOKEN_IDENTIFIER)
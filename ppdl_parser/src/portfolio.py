@@ -0,0 +1,115 @@
+import shutil
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .ast import parse_file_to_ast
+from .grounding import ground_task
+from .sas import SASTask, translate
+from .search import SearchResult, search
+from .successor_generator import SuccessorGenerator
+from .task import build_task
+from .workers import pool_context, worker_pool, worker_state
+
+# Portfolio paralelo de configuracoes de busca. O parse, o aterramento, a
+# traducao SAS+ e o gerador de sucessores sao feitos uma unica vez no processo
+# principal e herdados pelos processos de trabalho (fork). Sem ':metric', o
+# primeiro plano encontrado encerra as demais configuracoes; com ':metric',
+# cada configuracao repete a busca limitada pelo custo do ultimo plano ate nao
+# achar um mais barato (ou esgotar o orcamento) e vence o plano de menor custo.
+#
+# O encerramento e cooperativo: um Event compartilhado e verificado pela busca
+# junto do prazo, de modo que cada processo sai normalmente e limpa a propria
+# lista fechada. Os despejos em disco ficam em um diretorio por portfolio,
+# removido pelo processo principal em qualquer caso.
+
+# (nome, parametros de search(), orcamento de tempo em segundos)
+DEFAULT_PORTFOLIO: List[Tuple[str, dict, float]] = [
+    ('gbfs-goalcount', {'algorithm': 'gbfs', 'heuristic': 'goalcount'}, 60.0),
+    ('bfs-blind', {'algorithm': 'bfs', 'heuristic': 'blind'}, 60.0),
+]
+
+
+class PortfolioResult:
+    def __init__(self, winner: Optional[str], best: Optional[SearchResult],
+                 results: Dict[str, SearchResult], elapsed: float):
+        self.winner = winner
+        self.best = best
+        # Resultados das configuracoes que terminaram antes do encerramento
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def plan(self) -> Optional[List[str]]:
+        return self.best.plan if self.best is not None else None
+
+    def __repr__(self):
+        if self.best is None:
+            return f"PortfolioResult(sem solução, {self.elapsed:.3f}s)"
+        return (f"PortfolioResult(vencedor '{self.winner}', custo {self.best.cost}, "
+                f"{self.elapsed:.3f}s)")
+
+
+def _run_configuration(config) -> Tuple[str, SearchResult]:
+    name, options, budget = config
+    state = worker_state()
+    start = time.perf_counter()
+    options = dict(options)
+    options.setdefault('spill_dir', state['spill_dir'])
+    deadline = time.monotonic() + budget
+    try:
+        result = search(state['sas_task'], successor_generator=state['generator'],
+                        deadline=deadline, stop_event=state['stop'], **options)
+        while (state['optimize'] and result.solved and result.cost > 0
+               and time.monotonic() < deadline and not state['stop'].is_set()):
+            better = search(state['sas_task'], successor_generator=state['generator'],
+                            deadline=deadline, stop_event=state['stop'], bound=result.cost,
+                            **options)
+            if not better.solved:
+                break
+            better.expanded += result.expanded
+            better.generated += result.generated
+            better.elapsed = time.perf_counter() - start
+            result = better
+    except Exception as e:
+        # Uma configuracao invalida nao derruba o portfolio
+        result = SearchResult(None, None, 0, 0, time.perf_counter() - start, {}, error=str(e))
+    return name, result
+
+
+def run_portfolio(sas_task: SASTask, configurations=None, optimize_cost: bool = False,
+                  processes: Optional[int] = None, verbose: bool = True) -> PortfolioResult:
+    configurations = list(configurations or DEFAULT_PORTFOLIO)
+    generator = SuccessorGenerator(sas_task)
+    start = time.perf_counter()
+    results: Dict[str, SearchResult] = {}
+    winner, best = None, None
+    stop = pool_context().Event()
+    spill_dir = tempfile.mkdtemp(prefix='portfolio-')
+
+    try:
+        with worker_pool(processes or len(configurations), sas_task=sas_task, generator=generator,
+                         stop=stop, spill_dir=spill_dir, optimize=optimize_cost) as pool:
+            for name, result in pool.imap_unordered(_run_configuration, configurations):
+                results[name] = result
+                if verbose:
+                    print(f"   [Portfolio]: '{name}' terminou: {result}")
+                if result.solved and (best is None or result.cost < best.cost):
+                    winner, best = name, result
+                    if not optimize_cost:
+                        break
+            # Pede as demais configuracoes que parem e espera que saiam normalmente
+            stop.set()
+            pool.close()
+            pool.join()
+    finally:
+        shutil.rmtree(spill_dir, ignore_errors=True)
+    return PortfolioResult(winner, best, results, time.perf_counter() - start)
+
+
+def solve(domain_path: str, problem_path: str, configurations=None,
+          processes: Optional[int] = None, verbose: bool = True) -> PortfolioResult:
+    task = build_task(parse_file_to_ast(domain_path), parse_file_to_ast(problem_path), verbose)
+    sas_task = translate(ground_task(task, verbose=verbose), verbose)
+    optimize_cost = task.problem.metric is not None
+    return run_portfolio(sas_task, configurations, optimize_cost, processes, verbose)
@@ -0,0 +1,295 @@
+from typing import Dict, List, Optional, Tuple
+
+from .grounding import GroundTask
+from .invariants import find_invariants, mutex_groups
+
+# Codificacao da tarefa aterrada em variaveis de dominio finito (SAS+) e
+# exportacao no formato 'output.sas' do Fast Downward (versao 3).
+
+NONE_OF_THOSE = '<none of those>'
+
+
+def atom_name(atom: tuple) -> str:
+    return f"{atom[0]}({', '.join(atom[1:])})"
+
+
+class SASOperator:
+    def __init__(self, name: str, prevail: List[Tuple[int, int]],
+                 pre_post: List[Tuple[List[Tuple[int, int]], int, int, int]], cost: int = 1):
+        self.name = name
+        self.prevail = prevail
+        # Lista de (condicoes do efeito, variavel, valor anterior ou -1, novo valor)
+        self.pre_post = pre_post
+        self.cost = cost
+
+
+class SASTask:
+    def __init__(self, variables: List[List[str]], mutexes: List[List[Tuple[int, int]]],
+                 init: Tuple[int, ...], goal: List[Tuple[int, int]],
+                 operators: List[SASOperator], use_metric: bool = False):
+        # variables[v] = nomes dos valores da variavel v
+        self.variables = variables
+        self.mutexes = mutexes
+        self.init = init
+        self.goal = goal
+        self.operators = operators
+        self.use_metric = use_metric
+
+
+def _negated_atoms(condition, negated: set):
+    if condition is True or condition is False or not condition:
+        return
+    if condition[0] == 'not':
+        negated.add(tuple(condition[1]))
+    elif condition[0] in ('and', 'or', 'imply'):
+        for sub in condition[1:]:
+            _negated_atoms(sub, negated)
+
+
+def _choose_groups(ground_task: GroundTask, groups: List[List[tuple]]) -> List[List[tuple]]:
+    """Cobertura gulosa: cada atomo pertence a exatamente uma variavel."""
+    # Atomos negados (precondicoes, objetivo, condicoes de efeitos) ficam em variaveis binarias
+    negated = set()
+    for action in ground_task.actions:
+        negated.update(action.negative_precondition)
+        for condition, _, _, _ in action.conditional_effects:
+            _negated_atoms(condition, negated)
+    _negated_atoms(ground_task.goal, negated)
+    uncovered = set(ground_task.atoms) - negated
+    candidates = [set(g) & uncovered for g in groups]
+    chosen = []
+    while True:
+        candidates = [c & uncovered for c in candidates]
+        best = max(candidates, key=len, default=set())
+        if len(best) <= 1:
+            break
+        chosen.append(sorted(best))
+        uncovered -= best
+    chosen.extend([atom] for atom in sorted(uncovered))
+    chosen.extend([atom] for atom in sorted(negated & set(ground_task.atoms)))
+    return chosen
+
+
+def _needs_none_value(ground_task: GroundTask, group: List[tuple]) -> bool:
+    members = set(group)
+    if len(group) == 1 or sum(1 for a in group if a in ground_task.init) != 1:
+        return True
+    for action in ground_task.actions:
+        deleted = members.intersection(action.delete_effects)
+        if deleted and not members.intersection(action.add_effects):
+            return True
+        for _, add, delete, _ in action.conditional_effects:
+            if members.intersection(add) or members.intersection(delete):
+                return True
+    return False
+
+
+def _action_cost(action, numeric_init: Dict[tuple, float]) -> Optional[int]:
+    """Soma dos '(increase (total-cost) c)'; c e um numero ou um fluente aterrado.
+
+    Como os unicos efeitos numericos aceitos sao sobre 'total-cost', os
+    demais fluentes nunca mudam e termos como '(road-length a b)' sao lidos
+    dos valores iniciais do problema.
+    """
+    cost = None
+    for effect in action.numeric_effects:
+        op, fluent, value = effect
+        if op != 'increase' or fluent != ['total-cost']:
+            raise RuntimeError(
+                f"Erro de Tradução: efeito numérico '{op}' em {action.full_name} "
+                f"não é representável em SAS+")
+        if isinstance(value, str):
+            try:
+                amount = float(value)
+            except ValueError:
+                amount = None
+        elif value == ['total-cost'] or any(isinstance(term, list) for term in value):
+            amount = None
+        else:
+            amount = numeric_init.get(tuple(value))
+            if amount is None:
+                raise RuntimeError(
+                    f"Erro de Tradução: custo '({' '.join(value)})' de {action.full_name} "
+                    f"não tem valor inicial")
+        if amount is None:
+            raise RuntimeError(
+                f"Erro de Tradução: custo de {action.full_name} não é um número nem um "
+                f"fluente aterrado")
+        cost = (cost or 0) + int(amount)
+    return cost
+
+
+def _conjunction(condition) -> List[tuple]:
+    if condition is True:
+        return []
+    parts = condition[1:] if condition[0] == 'and' else [condition]
+    literals = []
+    for part in parts:
+        if part[0] in ('or', 'imply', 'exists', 'forall') or \
+                (part[0] == 'not' and part[1][0] in ('and', 'or', 'not')):
+            raise RuntimeError("Erro de Tradução: apenas conjunções de literais são suportadas em SAS+")
+        literals.append(part)
+    return literals
+
+
+def _consistent(pairs) -> Optional[Dict[int, int]]:
+    """Atribuicao (variavel -> valor) ou None se exigir dois valores da mesma variavel."""
+    assignment: Dict[int, int] = {}
+    for var, value in pairs:
+        if assignment.setdefault(var, value) != value:
+            return None
+    return assignment
+
+
+def translate(ground_task: GroundTask, verbose: bool = True) -> SASTask:
+    if ground_task.goal is False:
+        raise RuntimeError("Erro de Tradução: objetivo inalcançável (análise relaxada)")
+    invariants = find_invariants(ground_task.task, verbose=verbose)
+    instantiated = mutex_groups(ground_task, invariants)
+    groups = _choose_groups(ground_task, instantiated)
+
+    variables: List[List[str]] = []
+    # fact -> (variavel, valor verdadeiro, valor falso ou None)
+    lookup: Dict[tuple, Tuple[int, int, Optional[int]]] = {}
+    for group in groups:
+        var = len(variables)
+        names = [f"Atom {atom_name(atom)}" for atom in group]
+        none_value = None
+        if len(group) == 1:
+            names.append(f"NegatedAtom {atom_name(group[0])}")
+            none_value = 1
+        elif _needs_none_value(ground_task, group):
+            names.append(NONE_OF_THOSE)
+            none_value = len(group)
+        for value, atom in enumerate(group):
+            lookup[atom] = (var, value, none_value)
+        variables.append(names)
+
+    def literal(lit) -> Tuple[int, int]:
+        if lit[0] == 'not':
+            var, _, none_value = lookup[tuple(lit[1])]
+            if none_value is None or len(variables[var]) != 2:
+                raise RuntimeError(f"Erro de Tradução: condição negativa não binária {lit}")
+            return var, none_value
+        var, value, _ = lookup[tuple(lit)]
+        return var, value
+
+    init = []
+    for names, group in zip(variables, groups):
+        true_atoms = [i for i, atom in enumerate(group) if atom in ground_task.init]
+        init.append(true_atoms[0] if true_atoms else len(names) - 1)
+
+    if ground_task.goal is True:
+        goal = []
+    else:
+        goal_literals = _conjunction(ground_task.goal)
+        if any(lit[0] in ('<', '>', '<=', '>=', '=') for lit in goal_literals):
+            raise RuntimeError("Erro de Tradução: objetivos numéricos não são suportados em SAS+")
+        goal = sorted(set(literal(lit) for lit in goal_literals))
+
+    operators = []
+    use_metric = False
+    numeric_init = ground_task.task.problem.numeric_init
+    for action in ground_task.actions:
+        if action.condition is not None or action.numeric_preconditions:
+            raise RuntimeError(f"Erro de Tradução: precondição de {action.full_name} "
+                               f"não é uma conjunção de literais")
+        cost = _action_cost(action, numeric_init)
+        use_metric = use_metric or cost is not None
+        pre = _consistent([literal(a) for a in action.precondition] +
+                          [literal(['not', list(a)]) for a in action.negative_precondition])
+        if pre is None:
+            # Dois atomos mutuamente exclusivos na precondicao: acao inaplicavel
+            continue
+
+        effects: Dict[Tuple[tuple, int], int] = {}
+
+        def delete_effect(atom, conds):
+            var, value, none_value = lookup[atom]
+            if none_value is None or ((), var) in effects or (conds, var) in effects:
+                return  # a adicao na mesma variavel prevalece (remover, depois adicionar)
+            known = dict(conds).get(var, pre.get(var))
+            if known is None and len(variables[var]) > 2:
+                # Em STRIPS remover um atomo falso nao faz nada: em um grupo com varios
+                # atomos o efeito so vale se o atomo removido for o verdadeiro
+                conds = tuple(sorted(set(conds) | {(var, value)}))
+            elif known is not None and known != value:
+                return
+            effects.setdefault((conds, var), none_value)
+
+        for atom in action.add_effects:
+            var, value, _ = lookup[atom]
+            effects[((), var)] = value
+        for atom in action.delete_effects:
+            delete_effect(atom, ())
+        for condition, add, delete, numeric in action.conditional_effects:
+            if numeric:
+                raise RuntimeError(
+                    f"Erro de Tradução: efeito numérico condicional em {action.full_name} "
+                    f"não é representável em SAS+")
+            cond_assignment = _consistent(literal(lit) for lit in _conjunction(condition))
+            if cond_assignment is None:
+                continue
+            conds = tuple(sorted(cond_assignment.items()))
+            for atom in add:
+                var, value, _ = lookup[atom]
+                effects[(conds, var)] = value
+            for atom in delete:
+                delete_effect(atom, conds)
+
+        pre_post = [(list(conds), var, pre.get(var, -1), value)
+                    for (conds, var), value in sorted(effects.items())
+                    if value != pre.get(var, -1) or conds]
+        affected = {var for _, var, _, _ in pre_post}
+        prevail = sorted((var, value) for var, value in pre.items() if var not in affected)
+        operators.append(SASOperator(action.full_name[1:-1], prevail, pre_post,
+                                     cost if cost is not None else 1))
+
+    mutexes = []
+    for group_atoms in instantiated:
+        facts = [(lookup[a][0], lookup[a][1]) for a in group_atoms if a in lookup]
+        if len({var for var, _ in facts}) > 1:
+            mutexes.append(facts)
+
+    sas_task = SASTask(variables, mutexes, tuple(init), goal, operators, use_metric)
+    if verbose:
+        print(f"   [SAS]: {len(variables)} variáveis (de {len(ground_task.atoms)} átomos), "
+              f"{len(operators)} operadores.")
+    return sas_task
+
+
+def write_sas(sas_task: SASTask, path: str = 'output.sas', verbose: bool = True):
+    lines = ['begin_version', '3', 'end_version',
+             'begin_metric', '1' if sas_task.use_metric else '0', 'end_metric',
+             str(len(sas_task.variables))]
+    for var, names in enumerate(sas_task.variables):
+        lines += ['begin_variable', f'var{var}', '-1', str(len(names))]
+        lines += names
+        lines.append('end_variable')
+
+    lines.append(str(len(sas_task.mutexes)))
+    for group in sas_task.mutexes:
+        lines += ['begin_mutex_group', str(len(group))]
+        lines += [f'{var} {value}' for var, value in group]
+        lines.append('end_mutex_group')
+
+    lines += ['begin_state'] + [str(v) for v in sas_task.init] + ['end_state']
+    lines += ['begin_goal', str(len(sas_task.goal))]
+    lines += [f'{var} {value}' for var, value in sas_task.goal]
+    lines.append('end_goal')
+
+    lines.append(str(len(sas_task.operators)))
+    for op in sas_task.operators:
+        lines += ['begin_operator', op.name, str(len(op.prevail))]
+        lines += [f'{var} {value}' for var, value in op.prevail]
+        lines.append(str(len(op.pre_post)))
+        for conds, var, pre, post in op.pre_post:
+            cond_str = ' '.join(f'{v} {val}' for v, val in conds)
+            lines.append(' '.join(filter(None, [str(len(conds)), cond_str, str(var), str(pre), str(post)])))
+        lines += [str(op.cost), 'end_operator']
+    lines.append('0')
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    if verbose:
+        print(f"   [SAS]: Tarefa exportada para '{path}'.")
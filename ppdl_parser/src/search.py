@@ -0,0 +1,141 @@
+import heapq
+import time
+from collections import deque
+from typing import List, Optional
+
+from .closed_list import ClosedList
+from .sas import SASTask
+from .successor_generator import SuccessorGenerator
+
+# Busca progressiva sobre a tarefa SAS+. Os estados visitados ficam apenas na
+# lista fechada compacta (src/closed_list.py); a lista aberta guarda somente
+# ids inteiros. O tamanho estimado da lista aberta e informado a lista
+# fechada e entra no mesmo orcamento; se ele nao puder ser respeitado nem
+# despejando segmentos em disco, a busca e interrompida sem solucao.
+
+# bfs: busca em largura (otima para custo unitario); gbfs: gulosa pela heuristica
+ALGORITHMS = ('bfs', 'gbfs')
+HEURISTICS = ('goalcount', 'blind')
+
+# Bytes medidos (tracemalloc) por entrada da lista aberta: um int em uma
+# deque (bfs) ou uma tupla (h, contador, id) em um heap (gbfs)
+_OPEN_ENTRY_BYTES = {'bfs': 40, 'gbfs': 136}
+
+
+class SearchResult:
+    def __init__(self, plan: Optional[List[str]], cost: Optional[int], expanded: int,
+                 generated: int, elapsed: float, closed_stats: dict, error: Optional[str] = None):
+        self.plan = plan
+        self.cost = cost
+        self.expanded = expanded
+        self.generated = generated
+        self.elapsed = elapsed
+        self.closed_stats = closed_stats
+        # Mensagem de erro quando a busca nao pode ser executada (ex.: no portfolio)
+        self.error = error
+
+    @property
+    def solved(self) -> bool:
+        return self.plan is not None
+
+    def __repr__(self):
+        if self.error is not None:
+            return f"SearchResult(erro: {self.error})"
+        status = f"custo {self.cost}" if self.solved else "sem solução"
+        return (f"SearchResult({status}, {self.expanded} expandidos, "
+                f"{self.generated} gerados, {self.elapsed:.3f}s)")
+
+
+def _goal_count(goal):
+    def heuristic(state) -> int:
+        return sum(1 for var, value in goal if state[var] != value)
+    return heuristic
+
+
+def _blind(state) -> int:
+    return 0
+
+
+def apply_operator(sas_task: SASTask, op_index: int, state: tuple) -> tuple:
+    successor = list(state)
+    for conditions, var, _, post in sas_task.operators[op_index].pre_post:
+        if all(state[c_var] == c_value for c_var, c_value in conditions):
+            successor[var] = post
+    return tuple(successor)
+
+
+def search(sas_task: SASTask, algorithm: str = 'gbfs', heuristic: str = 'goalcount',
+           memory_budget: Optional[int] = None, spill_dir: Optional[str] = None,
+           max_expansions: Optional[int] = None, deadline: Optional[float] = None,
+           successor_generator: Optional[SuccessorGenerator] = None,
+           stop_event=None, bound: Optional[int] = None) -> SearchResult:
+    """Busca um plano. 'memory_budget' (bytes) limita a parte da lista fechada em RAM.
+
+    'deadline' e um instante de time.monotonic() apos o qual a busca desiste.
+    A busca tambem desiste se o orcamento de memoria nao puder ser respeitado
+    (closed_stats['over_budget']) ou quando 'stop_event' (ex.: um
+    multiprocessing.Event) for sinalizado; ambos sao verificados junto do prazo.
+    Com 'bound', sucessores com custo acumulado >= bound sao descartados, de
+    modo que so planos estritamente mais baratos que o limite sao encontrados.
+    """
+    if algorithm not in ALGORITHMS:
+        raise RuntimeError(f"Erro de Busca: algoritmo '{algorithm}' desconhecido ({', '.join(ALGORITHMS)})")
+    if heuristic not in HEURISTICS:
+        raise RuntimeError(f"Erro de Busca: heurística '{heuristic}' desconhecida ({', '.join(HEURISTICS)})")
+
+    start = time.perf_counter()
+    generator = successor_generator or SuccessorGenerator(sas_task)
+    h = _goal_count(sas_task.goal) if heuristic == 'goalcount' else _blind
+    unsatisfied_goals = _goal_count(sas_task.goal)
+    costs = [op.cost if sas_task.use_metric else 1 for op in sas_task.operators]
+
+    closed = ClosedList([len(values) for values in sas_task.variables], memory_budget,
+                        spill_dir=spill_dir)
+    try:
+        init_id, _ = closed.insert(sas_task.init)
+        counter = 0
+        if algorithm == 'bfs':
+            open_list = deque([init_id])
+            pop, push = open_list.popleft, open_list.append
+        else:
+            open_list = [(h(sas_task.init), 0, init_id)]
+            pop = lambda: heapq.heappop(open_list)[2]
+            push = lambda entry: heapq.heappush(open_list, entry)
+
+        entry_bytes = _OPEN_ENTRY_BYTES[algorithm]
+        expanded = generated = 0
+        while open_list:
+            state_id = pop()
+            state = closed.state(state_id)
+            _, _, g = closed.info(state_id)
+            if unsatisfied_goals(state) == 0:
+                plan = closed.trace(state_id)
+                return SearchResult([sas_task.operators[op].name for op in plan], g, expanded,
+                                    generated, time.perf_counter() - start, closed.stats())
+            if max_expansions is not None and expanded >= max_expansions:
+                break
+            if expanded % 256 == 0 and ((deadline is not None and time.monotonic() > deadline) or
+                                        (stop_event is not None and stop_event.is_set())):
+                break
+            if closed.over_budget:
+                break
+            expanded += 1
+            for op in generator.applicable_operators(state):
+                successor = apply_operator(sas_task, op, state)
+                succ_g = g + costs[op]
+                if bound is not None and succ_g >= bound:
+                    continue
+                succ_id, is_new = closed.insert(successor, state_id, op, succ_g)
+                if not is_new:
+                    continue
+                generated += 1
+                if algorithm == 'bfs':
+                    push(succ_id)
+                else:
+                    counter += 1
+                    push((h(successor), counter, succ_id))
+            if memory_budget is not None:
+                closed.set_external_usage(len(open_list) * entry_bytes)
+        return SearchResult(None, None, expanded, generated, time.perf_counter() - start, closed.stats())
+    finally:
+        closed.close()
@@ -0,0 +1,88 @@
+from typing import Dict, List, Optional, Tuple
+
+from .sas import SASTask
+
+# Gerador de sucessores em arvore de decisao (como no Fast Downward): cada
+# operador e inserido seguindo suas precondicoes (variavel, valor) em ordem
+# crescente de variavel. Um no testa uma variavel: o ramo do valor atual do
+# estado e o ramo "nao importa" sao visitados; os demais ramos sao podados.
+# A consulta visita apenas operadores cujas precondicoes podem valer.
+
+
+class _Node:
+    __slots__ = ('operators', 'var', 'children')
+
+    def __init__(self, operators: List[int], var: int):
+        # Operadores cujas precondicoes ja foram todas testadas no caminho ate aqui
+        self.operators = operators
+        self.var = var
+        # valor -> filho; a chave None guarda o ramo "nao importa"
+        self.children: Dict[Optional[int], '_Node'] = {}
+
+
+def operator_conditions(sas_task: SASTask) -> List[Tuple[Tuple[int, int], ...]]:
+    conditions = []
+    for op in sas_task.operators:
+        pre = dict(op.prevail)
+        for _, var, value, _ in op.pre_post:
+            if value != -1:
+                pre[var] = value
+        conditions.append(tuple(sorted(pre.items())))
+    return conditions
+
+
+class SuccessorGenerator:
+    def __init__(self, sas_task: SASTask):
+        self.conditions = operator_conditions(sas_task)
+        self.root = self._build([(op, 0) for op in range(len(self.conditions))]) if self.conditions else None
+
+    def _build(self, entries: List[Tuple[int, int]]) -> Optional[_Node]:
+        """entries: (indice do operador, posicao da proxima condicao a testar).
+
+        Construcao iterativa: tarefas grandes podem ter milhares de variaveis.
+        """
+        root: Dict[Optional[int], _Node] = {}
+        work = [(entries, root, None)]
+        while work:
+            entries, parent, key = work.pop()
+            immediate = []
+            pending = []
+            for op, pos in entries:
+                if pos == len(self.conditions[op]):
+                    immediate.append(op)
+                else:
+                    pending.append((op, pos))
+            if not pending:
+                parent[key] = _Node(immediate, -1)
+                continue
+
+            var = min(self.conditions[op][pos][0] for op, pos in pending)
+            node = _Node(immediate, var)
+            parent[key] = node
+            by_value: Dict[Optional[int], List[Tuple[int, int]]] = {}
+            for op, pos in pending:
+                cond_var, value = self.conditions[op][pos]
+                if cond_var == var:
+                    by_value.setdefault(value, []).append((op, pos + 1))
+                else:
+                    by_value.setdefault(None, []).append((op, pos))
+            for value, group in by_value.items():
+                work.append((group, node.children, value))
+        return root.get(None)
+
+    def applicable_operators(self, state: Tuple[int, ...]) -> List[int]:
+        result = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            result.extend(node.operators)
+            if node.var < 0:
+                continue
+            children = node.children
+            child = children.get(state[node.var])
+            if child is not None:
+                stack.append(child)
+            child = children.get(None)
+            if child is not None:
+                stack.append(child)
+        return result
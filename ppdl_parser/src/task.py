@@ -0,0 +1,219 @@
+from typing import Dict, List, Optional, Tuple
+
+# Modelo da tarefa de planejamento construido a partir da AST em listas
+# gerada por src/ast.py (cada expressao e uma lista de strings/sub-listas).
+
+NUMERIC_COMPARISONS = ('<', '>', '<=', '>=', '=')
+NUMERIC_EFFECTS = ('assign', 'increase', 'decrease', 'scale-up', 'scale-down')
+
+
+def is_variable(term) -> bool:
+    return isinstance(term, str) and term.startswith('?')
+
+
+def parse_typed_list(items, default_type='object') -> List[Tuple[str, object]]:
+    """Converte 'a b - t1 c - t2 d' em [(a, t1), (b, t1), (c, t2), (d, object)].
+
+    Tipos '(either t1 t2)' sao mantidos como tupla ('either', t1, t2).
+    """
+    result = []
+    pending = []
+    i = 0
+    while i < len(items):
+        item = items[i]
+        if item == '-':
+            if i + 1 >= len(items):
+                raise RuntimeError("Erro Semântico: '-' sem tipo em lista tipada")
+            type_name = items[i + 1]
+            if isinstance(type_name, list):
+                type_name = tuple(type_name)
+            result.extend((name, type_name) for name in pending)
+            pending = []
+            i += 2
+            continue
+        pending.append(item)
+        i += 1
+    result.extend((name, default_type) for name in pending)
+    return result
+
+
+def find_define_block(ast) -> list:
+    for form in ast:
+        if isinstance(form, list) and form and form[0] == 'define':
+            return form
+    raise RuntimeError("Erro Semântico: bloco 'define' não encontrado na AST")
+
+
+def _sections(define_block):
+    for section in define_block[2:]:
+        if isinstance(section, list) and section and isinstance(section[0], str):
+            yield section[0], section[1:]
+
+
+class ActionSchema:
+    def __init__(self, name: str, parameters: List[Tuple[str, object]], precondition, effect):
+        self.name = name
+        self.parameters = parameters
+        self.precondition = precondition
+        self.effect = effect
+
+    def __repr__(self):
+        return f"ActionSchema({self.name}, {self.parameters})"
+
+
+class Domain:
+    def __init__(self, name: str):
+        self.name = name
+        self.requirements: List[str] = []
+        self.types: Dict[str, object] = {}
+        self.constants: Dict[str, object] = {}
+        self.predicates: Dict[str, List[Tuple[str, object]]] = {}
+        self.functions: Dict[str, List[Tuple[str, object]]] = {}
+        self.actions: List[ActionSchema] = []
+        self._ancestors: Dict[str, List[str]] = {}
+
+    def type_ancestors(self, type_name: str) -> List[str]:
+        cached = self._ancestors.get(type_name)
+        if cached is not None:
+            return cached
+        ancestors = []
+        current = type_name
+        while current is not None and current not in ancestors:
+            ancestors.append(current)
+            current = self.types.get(current, 'object' if current != 'object' else None)
+            if isinstance(current, tuple):
+                current = None
+        if 'object' not in ancestors:
+            ancestors.append('object')
+        self._ancestors[type_name] = ancestors
+        return ancestors
+
+
+class Problem:
+    def __init__(self, name: str, domain_name: str):
+        self.name = name
+        self.domain_name = domain_name
+        self.objects: Dict[str, object] = {}
+        self.init = set()
+        self.numeric_init: Dict[tuple, float] = {}
+        self.goal = []
+        self.metric: Optional[Tuple[str, object]] = None
+
+
+class Task:
+    def __init__(self, domain: Domain, problem: Problem, verbose: bool = True):
+        if verbose and problem.domain_name != domain.name:
+            print(f"   [Task]: Aviso: problema referencia o domínio '{problem.domain_name}', "
+                  f"mas o domínio carregado é '{domain.name}'.")
+        self.domain = domain
+        self.problem = problem
+        self.objects: Dict[str, object] = dict(domain.constants)
+        self.objects.update(problem.objects)
+        self._objects_by_type: Dict[str, List[str]] = {}
+        for obj, obj_type in self.objects.items():
+            types = obj_type[1:] if isinstance(obj_type, tuple) else (obj_type,)
+            seen = set()
+            for declared in types:
+                for ancestor in domain.type_ancestors(declared):
+                    if ancestor not in seen:
+                        seen.add(ancestor)
+                        self._objects_by_type.setdefault(ancestor, []).append(obj)
+
+    def objects_of_type(self, type_spec) -> List[str]:
+        if isinstance(type_spec, (tuple, list)):
+            result = []
+            for type_name in type_spec[1:]:
+                for obj in self._objects_by_type.get(type_name, []):
+                    if obj not in result:
+                        result.append(obj)
+            return result
+        return self._objects_by_type.get(type_spec, [])
+
+
+def _to_tuple(expr) -> tuple:
+    return tuple(_to_tuple(e) if isinstance(e, list) else e for e in expr)
+
+
+def build_domain(ast) -> Domain:
+    define_block = find_define_block(ast)
+    header = define_block[1]
+    if not isinstance(header, list) or len(header) != 2 or header[0] != 'domain':
+        raise RuntimeError("Erro Semântico: esperava '(domain <nome>)' após 'define'")
+    domain = Domain(header[1])
+
+    for keyword, body in _sections(define_block):
+        if keyword == ':requirements':
+            domain.requirements = list(body)
+        elif keyword == ':types':
+            for type_name, parent in parse_typed_list(body):
+                domain.types[type_name] = parent
+        elif keyword == ':constants':
+            domain.constants.update(parse_typed_list(body))
+        elif keyword == ':predicates':
+            for predicate in body:
+                domain.predicates[predicate[0]] = parse_typed_list(predicate[1:])
+        elif keyword == ':functions':
+            i = 0
+            while i < len(body):
+                function = body[i]
+                domain.functions[function[0]] = parse_typed_list(function[1:])
+                # Tipo de retorno opcional ('- number')
+                i += 3 if i + 1 < len(body) and body[i + 1] == '-' else 1
+        elif keyword == ':action':
+            domain.actions.append(_build_action(body))
+    domain.types.pop('object', None)
+    return domain
+
+
+def _build_action(body) -> ActionSchema:
+    name = body[0]
+    parameters, precondition, effect = [], [], []
+    i = 1
+    while i + 1 < len(body):
+        key, value = body[i], body[i + 1]
+        if key == ':parameters':
+            parameters = parse_typed_list(value)
+        elif key == ':precondition':
+            precondition = value
+        elif key == ':effect':
+            effect = value
+        else:
+            raise RuntimeError(f"Erro Semântico: sub-seção '{key}' desconhecida na ação '{name}'")
+        i += 2
+    return ActionSchema(name, parameters, precondition, effect)
+
+
+def build_problem(ast) -> Problem:
+    define_block = find_define_block(ast)
+    header = define_block[1]
+    if not isinstance(header, list) or len(header) != 2 or header[0] != 'problem':
+        raise RuntimeError("Erro Semântico: esperava '(problem <nome>)' após 'define'")
+    problem_name = header[1]
+    domain_name = None
+    sections = list(_sections(define_block))
+    for keyword, body in sections:
+        if keyword == ':domain':
+            domain_name = body[0]
+    problem = Problem(problem_name, domain_name)
+
+    for keyword, body in sections:
+        if keyword == ':objects':
+            problem.objects.update(parse_typed_list(body))
+        elif keyword == ':init':
+            for fact in body:
+                if fact and fact[0] == '=':
+                    problem.numeric_init[_to_tuple(fact[1])] = float(fact[2])
+                elif fact and fact[0] == 'not':
+                    # Mundo fechado: fatos negados ja sao falsos
+                    continue
+                else:
+                    problem.init.add(tuple(fact))
+        elif keyword == ':goal':
+            problem.goal = body[0] if body else []
+        elif keyword == ':metric':
+            problem.metric = (body[0], body[1])
+    return problem
+
+
+def build_task(domain_ast, problem_ast, verbose: bool = True) -> Task:
+    return Task(build_domain(domain_ast), build_problem(problem_ast), verbose)
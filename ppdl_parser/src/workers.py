@@ -0,0 +1,35 @@
+import multiprocessing
+
+# Pools de processos com estado compartilhado: o estado e entregue aos
+# processos pelo inicializador do pool. Com o metodo 'fork' ele e herdado por
+# copia na escrita, sem serializacao; com 'spawn' e serializado uma vez por
+# processo (nunca por tarefa). Usado por batch.py, parallel_parser.py e
+# portfolio.py.
+
+_state: dict = {}
+
+
+def pool_context():
+    """Contexto 'fork' quando disponivel; senao, o contexto padrao da plataforma."""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def uses_fork() -> bool:
+    return pool_context().get_start_method() == 'fork'
+
+
+def _install_state(state: dict):
+    _state.clear()
+    _state.update(state)
+
+
+def worker_pool(processes: int, **state):
+    """Pool cujos processos recebem 'state' (ver worker_state)."""
+    return pool_context().Pool(processes, initializer=_install_state, initargs=(state,))
+
+
+def worker_state() -> dict:
+    """Estado entregue a este processo de trabalho por worker_pool."""
+    return _state
@@ -0,0 +1,52 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+EXAMPLES = os.path.join(ROOT, 'exemplos')
+sys.path.insert(0, ROOT)
+
+from src.ast import parse_file_to_ast, parse_tokens, tokenize  # noqa: E402
+from src.task import build_task  # noqa: E402
+
+
+def parse_source(source: str) -> list:
+    tokens = tokenize(source)
+    ast = []
+    while tokens:
+        ast.append(parse_tokens(tokens))
+    return ast
+
+
+@pytest.fixture
+def make_task():
+    """Constroi uma Task a partir do texto PDDL do dominio e do problema."""
+    def make(domain: str, problem: str):
+        return build_task(parse_source(domain), parse_source(problem))
+    return make
+
+
+@pytest.fixture
+def example_task():
+    """Task de um par dominio/problema de exemplos/, ex.: example_task('blocks')."""
+    def make(name: str):
+        return build_task(parse_file_to_ast(os.path.join(EXAMPLES, f'domain_{name}.pddl')),
+                          parse_file_to_ast(os.path.join(EXAMPLES, f'problem_{name}.pddl')))
+    return make
+
+
+def blocks_problem(n: int) -> str:
+    """Problema de blocks-world: n blocos na mesa, objetivo e uma torre b0 sobre b1 ..."""
+    blocks = [f"b{i}" for i in range(n)]
+    init = ' '.join(f"(ontable {b}) (clear {b})" for b in blocks)
+    goal = ' '.join(f"(on b{i} b{i + 1})" for i in range(n - 1))
+    return (f"(define (problem tower-{n}) (:domain blocks-world) (:objects {' '.join(blocks)} - block) "
+            f"(:init {init} (handempty)) (:goal (and {goal})))")
+
+
+@pytest.fixture
+def blocks_task(make_task):
+    with open(os.path.join(EXAMPLES, 'domain_blocks.pddl')) as f:
+        domain = f.read()
+    return lambda n: make_task(domain, blocks_problem(n))
@@ -0,0 +1,99 @@
+import os
+import shutil
+
+import pytest
+
+from conftest import EXAMPLES
+from src.batch import grounding_summary, run_batch
+from src.canonical import ResultCache
+
+# Mesmo problema com os fatos de ':init' em outra ordem
+REORDERED = """
+(define (problem blocks-reordered) (:domain blocks-world)
+  (:objects b a - block)
+  (:init (handempty) (clear a) (ontable a) (clear b) (ontable b))
+  (:goal (and (ontable b) (on a b))))
+"""
+
+
+def action_count(ground):
+    return len(ground.actions)
+
+
+@pytest.fixture
+def batch_files(tmp_path):
+    domain = tmp_path / 'domain.pddl'
+    shutil.copy(os.path.join(EXAMPLES, 'domain_blocks.pddl'), domain)
+    first = tmp_path / 'p1.pddl'
+    shutil.copy(os.path.join(EXAMPLES, 'problem_blocks.pddl'), first)
+    second = tmp_path / 'p2.pddl'
+    second.write_text(REORDERED)
+    return str(domain), [str(first), str(second)]
+
+
+def test_duplicate_problem_hits_cache(batch_files):
+    domain, problems = batch_files
+    cache = ResultCache()
+    results = list(run_batch(domain, problems, processes=1, cache=cache))
+    assert [r.cached for r in results] == [False, True]
+    assert results[0].value == results[1].value
+    assert cache.hits == 1
+
+
+def test_cache_key_includes_job(batch_files):
+    domain, problems = batch_files
+    cache = ResultCache()
+    list(run_batch(domain, problems[:1], grounding_summary, processes=1, cache=cache))
+    result, = run_batch(domain, problems[:1], action_count, processes=1, cache=cache)
+    assert not result.cached
+    assert isinstance(result.value, int)
+
+
+def test_anonymous_job_needs_namespace(batch_files):
+    domain, problems = batch_files
+    with pytest.raises(RuntimeError):
+        list(run_batch(domain, problems, lambda g: 0, processes=1, cache=ResultCache()))
+    results = list(run_batch(domain, problems, lambda g: 0, processes=1, cache=ResultCache(),
+                             cache_namespace='zero'))
+    assert [r.value for r in results] == [0, 0]
+
+
+def test_cache_key_includes_domain_contents(batch_files, tmp_path):
+    domain, problems = batch_files
+    path = str(tmp_path / 'cache.json')
+    cache = ResultCache(path)
+    list(run_batch(domain, problems[:1], processes=1, cache=cache))
+    cache.save()
+
+    with open(domain) as f:
+        text = f.read()
+    with open(domain, 'w') as f:
+        f.write(text.replace('(define (domain blocks-world)', '(define (domain blocks-world)\n'
+                             '  (:constants c - block)'))
+    result, = run_batch(domain, problems[:1], processes=1, cache=ResultCache(path))
+    assert not result.cached
+    assert result.value['actions'] > 0
+
+
+def test_parallel_batch_reports_worker_hits(batch_files):
+    domain, problems = batch_files
+    cache = ResultCache()
+    list(run_batch(domain, problems[:1], processes=1, cache=cache))
+    results = list(run_batch(domain, problems, processes=2, chunksize=1, cache=cache))
+    assert all(r.cached for r in results)
+    assert cache.hits == 2
+
+
+def test_bad_problem_does_not_abort_batch(batch_files, tmp_path, capsys):
+    domain, problems = batch_files
+    bad = tmp_path / 'bad.pddl'
+    # '(= (f) (+ 1 2))' faz float() receber uma lista (TypeError)
+    bad.write_text(REORDERED.replace('(handempty)', '(handempty) (= (f) (+ 1 2))'))
+    other = tmp_path / 'other-domain.pddl'
+    other.write_text(REORDERED.replace('(:domain blocks-world)', '(:domain outro)'))
+    for processes in (1, 2):
+        results = {os.path.basename(r.problem_path): r
+                   for r in run_batch(domain, problems + [str(bad), str(other)], processes=processes)}
+        assert not results['bad.pddl'].ok
+        assert results['other-domain.pddl'].ok and results['p1.pddl'].ok
+    assert '[Task]' not in capsys.readouterr().out
@@ -0,0 +1,73 @@
+import os
+import random
+
+from src.closed_list import EMPTY, ClosedList, StatePacker
+
+DOMAIN_SIZES = [3, 2, 5, 17, 2, 2, 9]
+
+
+def random_states(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    states = set()
+    while len(states) < count:
+        states.add(tuple(rng.randrange(size) for size in DOMAIN_SIZES))
+    return list(states)
+
+
+def test_packer_round_trip():
+    packer = StatePacker(DOMAIN_SIZES)
+    for state in random_states(200):
+        assert packer.unpack(packer.pack(state)) == state
+
+
+def test_insert_lookup_and_trace_round_trip():
+    closed = ClosedList(DOMAIN_SIZES, segment_records=64)
+    states = random_states(1000)
+    ids = []
+    for i, state in enumerate(states):
+        parent = ids[-1] if ids else EMPTY
+        state_id, is_new = closed.insert(state, parent, i, i)
+        assert is_new
+        ids.append(state_id)
+    assert closed.insert(states[10])[1] is False
+    for state_id, state in zip(ids, states):
+        assert closed.lookup(state) == state_id
+        assert closed.state(state_id) == state
+    assert closed.trace(ids[5]) == [1, 2, 3, 4, 5]
+    closed.close()
+
+
+def test_spill_keeps_records_and_cleans_up(tmp_path):
+    closed = ClosedList(DOMAIN_SIZES, memory_budget=64 * 1024, segment_records=256,
+                        spill_dir=str(tmp_path))
+    states = random_states(8000, seed=1)
+    for i, state in enumerate(states):
+        closed.insert(state, EMPTY, i, i)
+    stats = closed.stats()
+    assert stats['spilled_segments'] > 0
+    for i, state in enumerate(states):
+        state_id = closed.lookup(state)
+        assert closed.state(state_id) == state
+        assert closed.info(state_id) == (EMPTY, i, i)
+    closed.close()
+    assert os.listdir(tmp_path) == []
+
+
+def test_spilled_segments_do_not_hold_extra_file_descriptors(tmp_path):
+    before = len(os.listdir('/proc/self/fd')) if os.path.isdir('/proc/self/fd') else None
+    closed = ClosedList(DOMAIN_SIZES, memory_budget=16 * 1024, segment_records=64,
+                        spill_dir=str(tmp_path))
+    for i, state in enumerate(random_states(4000, seed=2)):
+        closed.insert(state, EMPTY, i, i)
+    assert closed.spilled_segments > 20
+    if before is not None:
+        assert len(os.listdir('/proc/self/fd')) - before <= closed.spilled_segments + 2
+    closed.close()
+
+
+def test_index_over_budget_is_reported():
+    closed = ClosedList(DOMAIN_SIZES, memory_budget=4 * 1024, segment_records=64)
+    for i, state in enumerate(random_states(4000, seed=3)):
+        closed.insert(state, EMPTY, i, i)
+    assert closed.stats()['over_budget']
+    closed.close()
@@ -0,0 +1,186 @@
+from itertools import product
+
+from src.grounding import (ACTION_PREFIX, TYPE_PREFIX, build_datalog_program, compute_model,
+                           ground_task)
+from src.task import NUMERIC_COMPARISONS, NUMERIC_EFFECTS, parse_typed_list
+
+COUNTER_DOMAIN = """
+(define (domain counter)
+  (:requirements :conditional-effects :numeric-fluents)
+  (:predicates (p) (q))
+  (:functions (counter))
+  (:action bump
+    :parameters ()
+    :precondition (q)
+    :effect (and (when (p) (increase (counter) 5)) (increase (counter) 1)))
+  (:action set-p
+    :parameters ()
+    :precondition (q)
+    :effect (p)))
+"""
+
+COUNTER_PROBLEM = """
+(define (problem counter-1) (:domain counter)
+  (:init (q) (= (counter) 0))
+  (:goal (>= (counter) 1)))
+"""
+
+
+def test_conditional_numeric_effect_stays_conditional(make_task):
+    ground = ground_task(make_task(COUNTER_DOMAIN, COUNTER_PROBLEM), verbose=False)
+    action = next(a for a in ground.actions if a.name == 'bump')
+    assert action.numeric_effects == (['increase', ['counter'], '1'],)
+    (condition, add, delete, numeric), = action.conditional_effects
+    assert condition == ['p']
+    assert (add, delete) == ((), ())
+    assert numeric == (['increase', ['counter'], '5'],)
+
+
+LOGISTICS_DOMAIN = """
+(define (domain mini-logistics)
+  (:requirements :typing :negative-preconditions :existential-preconditions
+                 :universal-preconditions :conditional-effects)
+  (:types place vehicle cargo - object truck - vehicle)
+  (:constants depot - place)
+  (:predicates (road ?a ?b - place) (closed ?p - place) (visited ?p - place)
+               (at ?x - (either vehicle cargo) ?p - place) (in ?c - cargo ?t - truck)
+               (marked ?x - (either truck cargo)) (done))
+  (:action drive
+    :parameters (?t - truck ?a ?b - place)
+    :precondition (and (at ?t ?a) (road ?a ?b) (not (closed ?b)))
+    :effect (and (not (at ?t ?a)) (at ?t ?b) (visited ?b)))
+  (:action load
+    :parameters (?c - cargo ?t - truck ?p - place)
+    :precondition (and (at ?c ?p) (at ?t ?p))
+    :effect (and (in ?c ?t) (not (at ?c ?p))))
+  (:action unload
+    :parameters (?c - cargo ?t - truck ?p - place)
+    :precondition (and (in ?c ?t) (at ?t ?p))
+    :effect (and (at ?c ?p) (not (in ?c ?t))))
+  (:action mark
+    :parameters (?x - (either truck cargo))
+    :precondition (exists (?p - place) (and (at ?x ?p) (visited ?p)))
+    :effect (and (marked ?x) (forall (?p - place) (when (road depot ?p) (visited ?p)))))
+  (:action finish
+    :parameters ()
+    :precondition (forall (?c - cargo) (at ?c depot))
+    :effect (done)))
+"""
+
+LOGISTICS_PROBLEM = """
+(define (problem mini-logistics-1) (:domain mini-logistics)
+  (:objects p1 p2 p3 p4 - place t1 - truck c1 c2 - cargo)
+  (:init (road depot p1) (road p1 p2) (road p2 depot) (road p3 p4) (closed p2)
+         (at t1 depot) (at c1 p1) (at c2 p3))
+  (:goal (done)))
+"""
+
+
+def _brute_force_reachability(task):
+    """Alcancabilidade relaxada por enumeracao de todas as instancias de acao.
+
+    Usa o mesmo relaxamento das regras Datalog: condicoes negativas,
+    universais e numericas valem sempre e remocoes sao ignoradas.
+    """
+    def holds(expr, binding, reached):
+        if not expr:
+            return True
+        head = expr[0]
+        if head == 'and':
+            return all(holds(e, binding, reached) for e in expr[1:])
+        if head == 'or':
+            return any(holds(e, binding, reached) for e in expr[1:])
+        if head == 'exists':
+            return any(holds(expr[2], inner, reached) for inner in bindings(expr[1], binding))
+        if head in ('not', 'imply', 'forall') or head in NUMERIC_COMPARISONS:
+            return True
+        return tuple(binding.get(t, t) for t in expr) in reached
+
+    def bindings(typed, binding):
+        typed_vars = parse_typed_list(typed) if not typed or isinstance(typed[0], str) else typed
+        for values in product(*(task.objects_of_type(t) for _, t in typed_vars)):
+            inner = dict(binding)
+            inner.update(zip((v for v, _ in typed_vars), values))
+            yield inner
+
+    def added(expr, binding, reached):
+        if not expr:
+            return
+        head = expr[0]
+        if head == 'and':
+            for e in expr[1:]:
+                yield from added(e, binding, reached)
+        elif head == 'forall':
+            for inner in bindings(expr[1], binding):
+                yield from added(expr[2], inner, reached)
+        elif head == 'when':
+            if holds(expr[1], binding, reached):
+                yield from added(expr[2], binding, reached)
+        elif head != 'not' and head not in NUMERIC_EFFECTS:
+            yield tuple(binding.get(t, t) for t in expr)
+
+    reached, instances = set(task.problem.init), set()
+    changed = True
+    while changed:
+        changed = False
+        for schema in task.domain.actions:
+            for binding in bindings(schema.parameters, {}):
+                if not holds(schema.precondition, binding, reached):
+                    continue
+                instances.add((schema.name,) + tuple(binding[v] for v, _ in schema.parameters))
+                new = set(added(schema.effect, binding, reached)) - reached
+                if new:
+                    reached |= new
+                    changed = True
+    return reached, instances
+
+
+def test_model_matches_brute_force_relaxed_reachability(make_task):
+    task = make_task(LOGISTICS_DOMAIN, LOGISTICS_PROBLEM)
+    model = compute_model(*build_datalog_program(task))
+    atoms = {a for a in model if not a[0].startswith((TYPE_PREFIX, ACTION_PREFIX))}
+    instances = {(a[0][len(ACTION_PREFIX):],) + a[1:] for a in model if a[0].startswith(ACTION_PREFIX)}
+
+    expected_atoms, expected_instances = _brute_force_reachability(task)
+    assert atoms == expected_atoms
+    assert instances == expected_instances
+
+
+def test_grounding_prunes_unreachable_and_statically_false_instances(make_task):
+    task = make_task(LOGISTICS_DOMAIN, LOGISTICS_PROBLEM)
+    ground = ground_task(task, verbose=False)
+    names = {(a.name,) + a.args for a in ground.actions}
+    _, relaxed = _brute_force_reachability(task)
+    assert names <= relaxed
+
+    # A ilha p3-p4 nunca e alcancada pelo caminhao
+    assert ('drive', 't1', 'p3', 'p4') not in names
+    assert ('load', 'c2', 't1', 'p3') not in names
+    # Relaxadamente alcancavel, mas (closed p2) e um fato estatico verdadeiro
+    assert ('drive', 't1', 'p1', 'p2') in relaxed
+    assert ('drive', 't1', 'p1', 'p2') not in names
+    # (at c2 depot) e inalcancavel, logo o forall sobre as cargas e falso
+    assert ('finish',) not in names
+    assert not any(a[0] in ('road', 'closed') for a in ground.atoms)
+    assert ground.static_predicates >= {'road', 'closed'}
+
+
+def test_grounding_simplifies_statics_constants_and_either(make_task):
+    ground = ground_task(make_task(LOGISTICS_DOMAIN, LOGISTICS_PROBLEM), verbose=False)
+    actions = {(a.name,) + a.args: a for a in ground.actions}
+
+    # (road depot p1) e (not (closed p1)) sao estaticos e somem da precondicao
+    drive = actions[('drive', 't1', 'depot', 'p1')]
+    assert drive.precondition == (('at', 't1', 'depot'),)
+    assert drive.negative_precondition == ()
+    assert drive.condition is None
+
+    # '(either truck cargo)' nao inclui lugares; a constante 'depot' e um lugar
+    assert {args[0] for name, *args in actions if name == 'mark'} <= {'t1', 'c1', 'c2'}
+    assert ('mark', 'depot') not in actions
+    mark = actions[('mark', 't1')]
+    # O exists vira uma disjuncao sobre os lugares alcancaveis
+    assert mark.condition[0] == 'or'
+    # O forall/when sobre a constante: so (road depot p1) e verdadeiro
+    assert mark.add_effects == (('marked', 't1'), ('visited', 'p1'))
+    assert mark.conditional_effects == ()
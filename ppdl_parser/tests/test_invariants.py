@@ -0,0 +1,47 @@
+from src.grounding import ground_task
+from src.invariants import find_invariants, mutex_groups
+from src.sas import translate
+from src.search import search
+
+# Contraexemplo: 'extra' adiciona (a) depois de um 'when'; {a, b} nao e mutex
+DOMAIN = """
+(define (domain unsound)
+  (:requirements :conditional-effects)
+  (:predicates (a) (b) (c))
+  (:action make-b
+    :parameters ()
+    :precondition (a)
+    :effect (and (not (a)) (b)))
+  (:action extra
+    :parameters ()
+    :precondition (c)
+    :effect (and (when (c) (c)) (a))))
+"""
+
+PROBLEM = """
+(define (problem unsound-1) (:domain unsound)
+  (:init (a) (c))
+  (:goal (and (a) (b))))
+"""
+
+
+def test_effects_after_when_are_not_ignored(make_task):
+    task = make_task(DOMAIN, PROBLEM)
+    invariants = find_invariants(task, verbose=False)
+    assert not any({'a', 'b'} <= {part[0] for part in inv} for inv in invariants)
+    groups = mutex_groups(ground_task(task, verbose=False), invariants)
+    assert not any({('a',), ('b',)} <= set(group) for group in groups)
+
+
+def test_counterexample_is_solvable(make_task):
+    sas_task = translate(ground_task(make_task(DOMAIN, PROBLEM), verbose=False), verbose=False)
+    result = search(sas_task, 'bfs', 'blind')
+    assert result.plan == ['make-b', 'extra']
+
+
+def test_blocks_invariants(example_task):
+    task = example_task('blocks')
+    groups = mutex_groups(ground_task(task, verbose=False), find_invariants(task, verbose=False))
+    # Nenhum grupo pode ter dois atomos verdadeiros no estado inicial
+    assert groups
+    assert all(sum(1 for atom in group if atom in task.problem.init) <= 1 for group in groups)
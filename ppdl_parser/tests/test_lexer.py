@@ -0,0 +1,55 @@
+import os
+
+from conftest import EXAMPLES
+from src.lexer import Lexer, SymbolTable, TokenCode
+from src.parser import Parser
+
+
+def symbols(lexer: Lexer) -> list:
+    ids = []
+    while True:
+        token = lexer.get_next_token()
+        if token.code == TokenCode.TOKEN_EOF:
+            return ids
+        if token.symbol_id >= 0:
+            ids.append((token.content, token.symbol_id))
+
+
+def test_each_lexer_has_its_own_table_by_default():
+    first, second = Lexer('(on a b)'), Lexer('(on b c)')
+    symbols(first)
+    symbols(second)
+    assert first.symbols is not second.symbols
+    assert len(first.symbols) == 3
+
+
+def test_shared_table_gives_consistent_ids():
+    table = SymbolTable()
+    ids = dict(symbols(Lexer('(on a b)', table)))
+    ids.update(dict(symbols(Lexer('(on b ?x)', table))))
+    assert len(table) == 4
+    assert table.name(ids['b']) == 'b'
+
+
+def test_parser_does_not_grow_a_global_table():
+    with open(os.path.join(EXAMPLES, 'domain_blocks.pddl')) as f:
+        source = f.read()
+    parser = Parser(source)
+    assert parser.parse()
+    size = len(parser.lexer.symbols)
+    again = Parser(source)
+    again.parse()
+    assert len(again.lexer.symbols) == size
+
+
+def test_shared_table_lets_problem_and_domain_compare_by_id():
+    table = SymbolTable()
+    parsers = []
+    for name in ('domain_blocks.pddl', 'problem_blocks.pddl', 'domain_helloworld.pddl'):
+        with open(os.path.join(EXAMPLES, name)) as f:
+            parser = Parser(f.read(), table)
+        assert parser.parse()
+        parsers.append(parser)
+    domain, problem, other = parsers
+    assert domain.domain_id == problem.domain_id >= 0
+    assert other.domain_id != problem.domain_id
@@ -0,0 +1,99 @@
+import math
+from array import array
+
+import pytest
+
+from src.numeric import FluentTable, compile_effects, compile_expression
+
+
+def test_non_finite_literals_compile():
+    table = FluentTable()
+    assert compile_expression('1e400', table)(array('d')) == math.inf
+    assert math.isnan(compile_expression('nan', table)(array('d')))
+    assert compile_expression(['-', 'inf'], table)(array('d')) == -math.inf
+
+
+def test_non_finite_literal_in_effect():
+    table = FluentTable()
+    apply = compile_effects([['assign', ['f'], 'inf']], table)
+    assert apply(array('d', [0.0]))[table.get(('f',))] == math.inf
+
+
+def test_conditional_numeric_effect_applies_only_under_condition(make_task):
+    from src.grounding import ground_task
+    from src.numeric import compile_numeric_task
+    from test_grounding import COUNTER_DOMAIN, COUNTER_PROBLEM
+
+    ground = ground_task(make_task(COUNTER_DOMAIN, COUNTER_PROBLEM), verbose=False)
+    numeric = compile_numeric_task(ground)
+    bump = next(i for i, a in enumerate(ground.actions) if a.name == 'bump')
+    counter = numeric.table.index[('counter',)]
+
+    assert numeric.apply(bump, numeric.init, frozenset({('q',)}))[counter] == 1
+    assert numeric.apply(bump, numeric.init, frozenset({('q',), ('p',)}))[counter] == 6
+    with pytest.raises(RuntimeError):
+        numeric.apply(bump, numeric.init)
+
+
+LEVEL_DOMAIN = """
+(define (domain level)
+  (:requirements :strips :numeric-fluents :negative-preconditions :disjunctive-preconditions)
+  (:predicates (p))
+  (:functions (f))
+  (:action low
+    :parameters ()
+    :precondition (not (>= (f) 3))
+    :effect (increase (f) 1))
+  (:action either
+    :parameters ()
+    :precondition (or (= (f) 5) (p))
+    :effect (assign (f) 0))
+  (:action set-p
+    :parameters ()
+    :precondition (>= (f) 1)
+    :effect (p)))
+"""
+
+LEVEL_PROBLEM = """
+(define (problem level-1)
+  (:domain level)
+  (:init (= (f) 0))
+  (:goal (or (= (f) 4) (= (f) 7))))
+"""
+
+
+def _values(numeric, f):
+    values = numeric.init[:]
+    values[numeric.table.index[('f',)]] = f
+    return values
+
+
+def test_negated_and_disjunctive_numeric_preconditions(make_task):
+    from src.grounding import ground_task
+    from src.numeric import compile_numeric_task
+
+    ground = ground_task(make_task(LEVEL_DOMAIN, LEVEL_PROBLEM), verbose=False)
+    numeric = compile_numeric_task(ground)
+    low = next(i for i, a in enumerate(ground.actions) if a.name == 'low')
+    either = next(i for i, a in enumerate(ground.actions) if a.name == 'either')
+
+    assert numeric.applicable(low, _values(numeric, 2))
+    assert not numeric.applicable(low, _values(numeric, 3))
+
+    assert numeric.applicable(either, _values(numeric, 5), frozenset())
+    assert numeric.applicable(either, _values(numeric, 1), frozenset({('p',)}))
+    assert not numeric.applicable(either, _values(numeric, 1), frozenset())
+    # A disjuncao cita o atomo (p): sem o estado proposicional nao ha resposta
+    with pytest.raises(RuntimeError):
+        numeric.applicable(either, _values(numeric, 5))
+
+
+def test_disjunctive_numeric_goal_is_compiled(make_task):
+    from src.grounding import ground_task
+    from src.numeric import compile_numeric_task
+
+    numeric = compile_numeric_task(ground_task(make_task(LEVEL_DOMAIN, LEVEL_PROBLEM), verbose=False))
+    assert numeric.goal is not None
+    assert numeric.goal(_values(numeric, 4))
+    assert numeric.goal(_values(numeric, 7))
+    assert not numeric.goal(_values(numeric, 5))
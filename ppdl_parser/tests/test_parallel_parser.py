@@ -0,0 +1,38 @@
+import glob
+import os
+
+import pytest
+
+from conftest import EXAMPLES, parse_source
+from src.ast import parse_file_to_ast
+from src.parallel_parser import lex_and_parse, parse_file_parallel, parse_source_parallel
+
+
+VALID_EXAMPLES = sorted(path for path in glob.glob(os.path.join(EXAMPLES, '*.pddl'))
+                        if 'invalido' not in path)
+
+
+@pytest.mark.parametrize('path', VALID_EXAMPLES, ids=os.path.basename)
+def test_parallel_ast_matches_sequential(path):
+    assert parse_file_parallel(path, processes=1) == parse_file_to_ast(path)
+
+
+@pytest.mark.parametrize('source', [
+    '(at pos1.2)', '(= (c) .5)', '(at _x)', '(at a?b)', '(:init(on a b);x\n(at -1))',
+])
+def test_accepts_what_ast_accepts(source):
+    assert lex_and_parse(source) == parse_source(source)
+
+
+def test_split_sections_in_worker_pool():
+    facts = '\n'.join(f'(on b{i} b{i + 1}) ; fato {i}' for i in range(2000))
+    source = (f"(define (problem big) (:domain blocks)\n(:objects {' '.join(f'b{i}' for i in range(2001))})\n"
+              f"(:init\n{facts}\n)\n(:goal (on b0 b1)))")
+    expected = parse_source(source)
+    assert parse_source_parallel(source, processes=1, chunk_size=1024) == expected
+    assert parse_source_parallel(source, processes=2, chunk_size=1024) == expected
+
+
+def test_error_reports_original_line():
+    with pytest.raises(RuntimeError, match='linha 3'):
+        lex_and_parse('(a\n(b)\n))', first_line=1)
@@ -0,0 +1,88 @@
+import multiprocessing
+import os
+import tempfile
+
+import pytest
+
+from src.grounding import ground_task
+from src.portfolio import run_portfolio
+from src.sas import translate
+from src.search import search
+
+
+@pytest.fixture
+def sas_task(blocks_task):
+    return translate(ground_task(blocks_task(10), verbose=False), verbose=False)
+
+
+def test_invalid_configuration_is_recorded(sas_task):
+    configurations = [
+        ('broken', {'heuristic': 'nope'}, 10.0),
+        ('gbfs', {'algorithm': 'gbfs', 'heuristic': 'goalcount'}, 10.0),
+    ]
+    # Um unico processo roda as configuracoes na ordem: 'broken' termina antes do plano
+    result = run_portfolio(sas_task, configurations, processes=1)
+    assert result.winner == 'gbfs'
+    assert result.results['broken'].error is not None
+    assert not result.results['broken'].solved
+
+
+def test_losing_workers_clean_up_spill_directories(sas_task, tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    configurations = [
+        ('gbfs', {'algorithm': 'gbfs', 'heuristic': 'goalcount'}, 30.0),
+        ('bfs', {'algorithm': 'bfs', 'heuristic': 'blind', 'memory_budget': 64 * 1024}, 30.0),
+    ]
+    result = run_portfolio(sas_task, configurations, processes=2)
+    assert result.winner == 'gbfs'
+    assert os.listdir(tmp_path) == []
+
+
+def test_stop_event_interrupts_search(sas_task):
+    stop = multiprocessing.Event()
+    stop.set()
+    result = search(sas_task, 'bfs', 'blind', stop_event=stop)
+    assert not result.solved
+    assert result.expanded == 0
+
+
+def test_stopped_search_removes_its_spill_files(sas_task, tmp_path):
+    import time
+
+    from src.workers import pool_context
+
+    context = pool_context()
+    stop = context.Event()
+    worker = context.Process(target=search, args=(sas_task, 'bfs', 'blind'),
+                             kwargs={'memory_budget': 4 * 1024 * 1024, 'spill_dir': str(tmp_path),
+                                     'stop_event': stop})
+    worker.start()
+    deadline = time.monotonic() + 30
+    while not any(os.scandir(tmp_path)) and worker.is_alive() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert any(os.scandir(tmp_path)), 'a busca deveria ter despejado segmentos em disco'
+    stop.set()
+    worker.join(10)
+    assert worker.exitcode == 0
+    assert os.listdir(tmp_path) == []
+
+
+def test_solve_is_quiet_when_not_verbose(capsys):
+    from conftest import EXAMPLES
+    from src.portfolio import solve
+
+    result = solve(os.path.join(EXAMPLES, 'domain_blocks.pddl'), os.path.join(EXAMPLES, 'problem_blocks.pddl'),
+                   processes=1, verbose=False)
+    assert result.plan is not None
+    assert capsys.readouterr().out == ''
+
+
+def test_metric_keeps_searching_below_the_first_plan(make_task):
+    from test_search import ROAD_DOMAIN, ROAD_PROBLEM
+
+    sas_task = translate(ground_task(make_task(ROAD_DOMAIN, ROAD_PROBLEM), verbose=False), verbose=False)
+    configurations = [('gbfs', {'algorithm': 'gbfs', 'heuristic': 'goalcount'}, 30.0)]
+    assert run_portfolio(sas_task, configurations, processes=1, verbose=False).best.cost == 10
+    result = run_portfolio(sas_task, configurations, optimize_cost=True, processes=1, verbose=False)
+    assert result.plan == ['drive a b', 'drive b g']
+    assert result.best.cost == 2
@@ -0,0 +1,166 @@
+import random
+from collections import deque
+
+import pytest
+
+from src.grounding import ground_task
+from src.sas import translate, write_sas
+from src.search import search
+
+# Contraexemplo: 'clean' remove (at ?x) sem exigi-lo; com (at a) verdadeiro,
+# remover (at c) nao pode apagar a posicao atual
+MOVE_DOMAIN = """
+(define (domain move)
+  (:requirements :strips)
+  (:predicates (at ?x) (done))
+  (:action go
+    :parameters (?from ?to)
+    :precondition (at ?from)
+    :effect (and (not (at ?from)) (at ?to)))
+  (:action clean
+    :parameters (?x)
+    :precondition ()
+    :effect (and (not (at ?x)) (done))))
+"""
+
+MOVE_PROBLEM = """
+(define (problem move-1) (:domain move)
+  (:objects a b c)
+  (:init (at a))
+  (:goal (and (done) (at b))))
+"""
+
+
+def strips_bfs(ground):
+    """Comprimento do plano otimo por busca em largura direta sobre as acoes aterradas."""
+    goal = ground.goal
+    if goal is False:
+        return None
+    literals = [] if goal is True else (goal[1:] if goal[0] == 'and' else [goal])
+    positive = {tuple(lit) for lit in literals if lit[0] != 'not'}
+    negative = {tuple(lit[1]) for lit in literals if lit[0] == 'not'}
+    start = frozenset(ground.init)
+    distance = {start: 0}
+    queue = deque([start])
+    while queue:
+        state = queue.popleft()
+        if positive <= state and not negative & state:
+            return distance[state]
+        for action in ground.actions:
+            if set(action.precondition) <= state and not set(action.negative_precondition) & state:
+                successor = (state - set(action.delete_effects)) | set(action.add_effects)
+                if successor not in distance:
+                    distance[successor] = distance[state] + 1
+                    queue.append(successor)
+    return None
+
+
+def sas_bfs(ground):
+    result = search(translate(ground, verbose=False), 'bfs', 'blind')
+    return len(result.plan) if result.solved else None
+
+
+def test_delete_of_false_atom_is_a_no_op(make_task):
+    ground = ground_task(make_task(MOVE_DOMAIN, MOVE_PROBLEM), verbose=False)
+    assert strips_bfs(ground) == 2
+    assert sas_bfs(ground) == 2
+
+
+def random_task(rng: random.Random):
+    """Dominio STRIPS aleatorio em que (at ?x) e (on ?x) formam grupos mutex.
+
+    'move-*' preservam os grupos; as demais acoes podem remover atomos dos
+    grupos sem exigi-los na precondicao e mexem livremente em (p) e (q).
+    """
+    schemas = [
+        "(:action move-at :parameters (?x ?y) :precondition (at ?x) :effect (and (not (at ?x)) (at ?y)))",
+        "(:action move-on :parameters (?x ?y) :precondition (and (on ?x) (p)) "
+        ":effect (and (not (on ?x)) (on ?y)))",
+    ]
+    conditions = ['(at ?x)', '(on ?x)', '(at ?y)', '(p)', '(q)']
+    removable = ['(at ?x)', '(at ?y)', '(on ?x)', '(on ?y)', '(p)', '(q)']
+    for i in range(rng.randint(2, 4)):
+        pre = rng.sample(conditions, rng.randint(0, 2))
+        deletes = rng.sample(removable, rng.randint(1, 2))
+        adds = [a for a in rng.sample(['(p)', '(q)'], rng.randint(0, 1)) if a not in deletes]
+        effect = ' '.join(adds + [f'(not {d})' for d in deletes])
+        schemas.append(f"(:action a{i} :parameters (?x ?y) :precondition (and {' '.join(pre)}) "
+                       f":effect (and {effect}))")
+    domain = f"(define (domain rnd) (:predicates (at ?x) (on ?x) (p) (q)) {' '.join(schemas)})"
+    objects = ['o1', 'o2', 'o3']
+    init = [f'(at {rng.choice(objects)})', f'(on {rng.choice(objects)})']
+    goal = rng.sample([f'(at {o})' for o in objects] + [f'(on {o})' for o in objects] + ['(p)', '(q)'], 2)
+    problem = (f"(define (problem rnd-1) (:domain rnd) (:objects {' '.join(objects)}) "
+               f"(:init {' '.join(init)}) (:goal (and {' '.join(goal)})))")
+    return domain, problem
+
+
+@pytest.mark.parametrize('seed', range(60))
+def test_sas_search_matches_strips_bfs(make_task, seed):
+    domain, problem = random_task(random.Random(seed))
+    ground = ground_task(make_task(domain, problem), verbose=False)
+    if ground.goal is False:
+        return
+    assert sas_bfs(ground) == strips_bfs(ground)
+
+
+def test_write_sas_sections(blocks_task, tmp_path):
+    sas_task = translate(ground_task(blocks_task(3), verbose=False), verbose=False)
+    path = tmp_path / 'output.sas'
+    write_sas(sas_task, str(path), verbose=False)
+    lines = path.read_text().split('\n')
+    assert lines[:3] == ['begin_version', '3', 'end_version']
+    assert lines.count('begin_variable') == len(sas_task.variables)
+    assert lines.count('begin_operator') == len(sas_task.operators)
+
+
+def test_negative_goal(blocks_task):
+    task = blocks_task(3)
+    task.problem.goal = ['and', ['on', 'b0', 'b1'], ['not', ['ontable', 'b0']], ['not', ['clear', 'b1']]]
+    ground = ground_task(task, verbose=False)
+    assert sas_bfs(ground) == strips_bfs(ground) == 2
+
+
+NEGATED_WHEN_DOMAIN = """
+(define (domain lamp)
+  (:requirements :conditional-effects :negative-preconditions)
+  (:predicates (on ?l) (off ?l) (seen))
+  (:action switch
+    :parameters (?l)
+    :precondition (off ?l)
+    :effect (and (not (off ?l)) (on ?l)))
+  (:action look
+    :parameters (?l)
+    :precondition ()
+    :effect (when (not (off ?l)) (seen))))
+"""
+
+NEGATED_WHEN_PROBLEM = """
+(define (problem lamp-1) (:domain lamp)
+  (:objects l1)
+  (:init (off l1))
+  (:goal (seen)))
+"""
+
+
+def test_negated_conditional_effect_condition(make_task):
+    ground = ground_task(make_task(NEGATED_WHEN_DOMAIN, NEGATED_WHEN_PROBLEM), verbose=False)
+    result = search(translate(ground, verbose=False), 'bfs', 'blind')
+    assert result.plan == ['switch l1', 'look l1']
+
+
+def test_action_costs_are_read_from_the_initial_state(make_task):
+    from test_search import ROAD_DOMAIN, ROAD_PROBLEM
+
+    sas_task = translate(ground_task(make_task(ROAD_DOMAIN, ROAD_PROBLEM), verbose=False), verbose=False)
+    assert sas_task.use_metric
+    costs = {op.name: op.cost for op in sas_task.operators}
+    assert costs == {'drive a g': 10, 'drive a b': 1, 'drive b g': 1}
+
+
+def test_cost_without_initial_value_is_rejected(make_task):
+    from test_search import ROAD_DOMAIN, ROAD_PROBLEM
+
+    problem = ROAD_PROBLEM.replace('(= (road-length b g) 1)', '')
+    with pytest.raises(RuntimeError, match='road-length b g'):
+        translate(ground_task(make_task(ROAD_DOMAIN, problem), verbose=False), verbose=False)
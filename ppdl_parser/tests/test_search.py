@@ -0,0 +1,69 @@
+from src.grounding import ground_task
+from src.sas import translate
+from src.search import search
+
+
+def simulate(ground, plan) -> bool:
+    """Executa o plano sobre as acoes aterradas (STRIPS) e verifica o objetivo."""
+    actions = {action.full_name[1:-1]: action for action in ground.actions}
+    state = set(ground.init)
+    for name in plan:
+        action = actions[name]
+        if not set(action.precondition) <= state:
+            return False
+        state = (state - set(action.delete_effects)) | set(action.add_effects)
+    goal = ground.goal[1:] if ground.goal[0] == 'and' else [ground.goal]
+    return all(tuple(atom) in state for atom in goal)
+
+
+def test_plans_are_valid_and_bfs_is_shortest(blocks_task):
+    ground = ground_task(blocks_task(4), verbose=False)
+    sas_task = translate(ground, verbose=False)
+    bfs = search(sas_task, 'bfs', 'blind')
+    gbfs = search(sas_task, 'gbfs', 'goalcount')
+    assert simulate(ground, bfs.plan) and simulate(ground, gbfs.plan)
+    assert bfs.cost == len(bfs.plan) <= len(gbfs.plan)
+
+
+def test_spilling_search_finds_the_same_plan(blocks_task, tmp_path):
+    sas_task = translate(ground_task(blocks_task(6), verbose=False), verbose=False)
+    in_memory = search(sas_task, 'bfs', 'blind')
+    spilled = search(sas_task, 'bfs', 'blind', memory_budget=300 * 1000, spill_dir=str(tmp_path))
+    assert spilled.closed_stats['spilled_segments'] > 0
+    assert spilled.plan == in_memory.plan
+
+
+
+# A estrada direta custa 10; o desvio por b custa 2. A gulosa pela contagem
+# de objetivos acha primeiro a estrada direta.
+ROAD_DOMAIN = """
+(define (domain roads)
+  (:requirements :typing :action-costs)
+  (:types city)
+  (:predicates (at ?c - city) (road ?a ?b - city))
+  (:functions (road-length ?a ?b - city) (total-cost))
+  (:action drive
+    :parameters (?a ?b - city)
+    :precondition (and (at ?a) (road ?a ?b))
+    :effect (and (not (at ?a)) (at ?b) (increase (total-cost) (road-length ?a ?b)))))
+"""
+
+ROAD_PROBLEM = """
+(define (problem roads-1) (:domain roads)
+  (:objects a b g - city)
+  (:init (at a) (road a g) (road a b) (road b g)
+         (= (road-length a g) 10) (= (road-length a b) 1) (= (road-length b g) 1)
+         (= (total-cost) 0))
+  (:goal (at g))
+  (:metric minimize (total-cost)))
+"""
+
+
+def test_cost_bound_finds_a_cheaper_plan(make_task):
+    sas_task = translate(ground_task(make_task(ROAD_DOMAIN, ROAD_PROBLEM), verbose=False), verbose=False)
+    first = search(sas_task, 'gbfs', 'goalcount')
+    assert first.cost == 10
+    better = search(sas_task, 'gbfs', 'goalcount', bound=first.cost)
+    assert better.plan == ['drive a b', 'drive b g']
+    assert better.cost == 2
+    assert not search(sas_task, 'gbfs', 'goalcount', bound=better.cost).solved
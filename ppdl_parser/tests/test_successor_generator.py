@@ -0,0 +1,32 @@
+import random
+
+from src.grounding import ground_task
+from src.sas import translate
+from src.search import apply_operator
+from src.successor_generator import SuccessorGenerator, operator_conditions
+
+
+def linear_scan(conditions, state):
+    return [op for op, pre in enumerate(conditions) if all(state[var] == value for var, value in pre)]
+
+
+def test_matches_linear_scan_over_random_walk(blocks_task):
+    sas_task = translate(ground_task(blocks_task(5), verbose=False), verbose=False)
+    generator = SuccessorGenerator(sas_task)
+    conditions = operator_conditions(sas_task)
+    rng = random.Random(0)
+    state = tuple(sas_task.init)
+    for _ in range(500):
+        applicable = sorted(generator.applicable_operators(state))
+        assert applicable == linear_scan(conditions, state)
+        assert applicable
+        state = apply_operator(sas_task, rng.choice(applicable), state)
+
+
+def test_operators_without_preconditions_are_always_applicable(blocks_task):
+    sas_task = translate(ground_task(blocks_task(3), verbose=False), verbose=False)
+    for op in sas_task.operators[:2]:
+        op.prevail = []
+        op.pre_post = [(conds, var, -1, post) for conds, var, _, post in op.pre_post]
+    generator = SuccessorGenerator(sas_task)
+    assert {0, 1} <= set(generator.applicable_operators(tuple(sas_task.init)))